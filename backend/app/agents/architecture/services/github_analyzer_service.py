@@ -13,6 +13,7 @@ from pathlib import Path
 import logging
 from app.core.utils import safe_remove_directory
 from dataclasses import dataclass, asdict
+from functools import cached_property
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -20,6 +21,18 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# File extension groups used to classify files during repository walks
+_JS_EXTS = frozenset({'.js', '.jsx', '.ts', '.tsx', '.vue', '.svelte'})
+_CODE_EXTS = frozenset({'.py', '.js', '.ts'})
+_DB_EXTS = frozenset({'.sql', '.prisma'})
+
+# Quote and comment markers stripped from docstring/comment lines
+_PURPOSE_STRIP_RE = re.compile(r'["""\'#/\*]')
+
+# JSON extraction fallbacks for LLM responses that are not bare JSON
+_LLM_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{[\s\S]*?\})\s*```')
+_LLM_JSON_OBJ_RE = re.compile(r'\{[\s\S]*\}')
+
 @dataclass
 class APIEndpoint:
     method: str
@@ -55,6 +68,18 @@ class RepositoryAnalysis:
     dependencies: Dict[str, List[str]]
     folder_structure: Dict[str, Any]
     business_logic: List[str]
+    
+    @cached_property
+    def total_files(self) -> int:
+        """Number of files across all analyzed folders, computed once per analysis"""
+        total = 0
+        for folder_info in self.folder_structure.values():
+            try:
+                total += len(folder_info.get('files', ()))
+            except AttributeError:
+                # Non-dict entries carry no file list
+                continue
+        return total
 
 class GitHubAnalyzerService:
     def __init__(self):
@@ -389,7 +414,7 @@ class GitHubAnalyzerService:
                 continue
             
             for file in files:
-                if any(file.endswith(ext) for ext in ['.js', '.jsx', '.ts', '.tsx', '.vue', '.svelte']):
+                if os.path.splitext(file)[1] in _JS_EXTS:
                     file_path = os.path.join(root, file)
                     
                     # Categorize files
@@ -628,6 +653,9 @@ class GitHubAnalyzerService:
                 ]
                 
                 for i, line in enumerate(lines):
+                    # Purpose is resolved lazily and shared by every match on this line
+                    purpose = None
+                    
                     # Check explicit endpoint patterns
                     for pattern in patterns:
                         matches = re.finditer(pattern, line, re.IGNORECASE)
@@ -641,11 +669,14 @@ class GitHubAnalyzerService:
                                     method = match.group(1).upper()
                                     path = match.group(2) if '/' in match.group(2) else match.group(1)
                                 
+                                if purpose is None:
+                                    purpose = self._extract_function_purpose(lines, i)
+                                
                                 endpoints.append({
                                     'method': method,
                                     'path': path,
                                     'line_number': i + 1,
-                                    'purpose': self._extract_function_purpose(lines, i),
+                                    'purpose': purpose,
                                     'input_schema': {},
                                     'output_schema': {},
                                     'dependencies': []
@@ -821,7 +852,7 @@ class GitHubAnalyzerService:
             dirs[:] = [d for d in dirs if d not in ['node_modules', '__pycache__', '.git']]
             
             for file in files:
-                if any(file.endswith(ext) for ext in ['.js', '.jsx', '.ts', '.tsx', '.vue', '.svelte']):
+                if os.path.splitext(file)[1] in _JS_EXTS:
                     file_path = os.path.join(root, file)
                     
                     component = ComponentInfo(
@@ -919,7 +950,7 @@ class GitHubAnalyzerService:
         db_files = []
         for root, dirs, files in os.walk(repo_path):
             for file in files:
-                if any(file.endswith(ext) for ext in ['.sql', '.prisma']) or 'migration' in file.lower():
+                if os.path.splitext(file)[1] in _DB_EXTS or 'migration' in file.lower():
                     db_files.append(os.path.join(root, file))
         
         for file_path in db_files:
@@ -1043,7 +1074,7 @@ class GitHubAnalyzerService:
             dirs[:] = [d for d in dirs if d not in ['node_modules', '__pycache__', '.git']]
             
             for file in files:
-                if any(file.endswith(ext) for ext in ['.py', '.js', '.ts']):
+                if os.path.splitext(file)[1] in _CODE_EXTS:
                     file_path = os.path.join(root, file)
                     
                     try:
@@ -1063,12 +1094,13 @@ class GitHubAnalyzerService:
         """Extract function purpose from docstring or comments"""
         purpose = ""
         
-        # Look for docstring or comments near the function
-        for i in range(max(0, line_index - 2), min(len(lines), line_index + 5)):
-            line = lines[i].strip()
-            if '"""' in line or "'''" in line or line.startswith('#') or line.startswith('//'):
+        # Look for docstring or comments near the function. ``lines`` is split
+        # once per file by the caller, so only the small window is visited here.
+        for raw_line in lines[max(0, line_index - 2):line_index + 5]:
+            line = raw_line.strip()
+            if '"""' in line or "'''" in line or line.startswith(('#', '//')):
                 # Extract meaningful text
-                clean_line = re.sub(r'["""\'#/\*]', '', line).strip()
+                clean_line = _PURPOSE_STRIP_RE.sub('', line).strip()
                 if len(clean_line) > 10:
                     purpose = clean_line[:100]
                     break
@@ -1086,7 +1118,7 @@ class GitHubAnalyzerService:
                 'project_name': repo_analysis.project_name,
                 'description': repo_analysis.description,
                 'languages': repo_analysis.tech_stack.get('languages', []),
-                'file_count': sum(len(folder_info.get('files', [])) for folder_info in repo_analysis.folder_structure.values() if isinstance(folder_info, dict)),
+                'file_count': repo_analysis.total_files,
                 'folder_structure': list(repo_analysis.folder_structure.keys())[:10],  # Top 10 folders
                 'dependencies': {
                     'production': repo_analysis.dependencies.get('production', [])[:10],
@@ -1131,21 +1163,24 @@ class GitHubAnalyzerService:
             if llm_response:
                 # Try to parse JSON response using robust extraction
                 try:
-                    import json
                     content = llm_response.strip()
                     
-                    # Robust extraction method matches what PlannerAgent uses
-                    # Method 1: Extract from markdown code blocks
-                    json_match = re.search(r'```(?:json)?\s*(\{[\s\S]*?\})\s*```', content, re.DOTALL)
-                    if json_match:
-                        content = json_match.group(1)
-                    else:
-                        # Method 2: Find JSON object directly (greedy match)
-                        json_match = re.search(r'\{[\s\S]*\}', content)
+                    try:
+                        # Fast path: well-behaved models return bare JSON
+                        llm_analysis = json.loads(content)
+                    except ValueError:
+                        # Robust extraction method matches what PlannerAgent uses
+                        # Method 1: Extract from markdown code blocks
+                        json_match = _LLM_JSON_FENCE_RE.search(content)
                         if json_match:
-                            content = json_match.group(0)
-                    
-                    llm_analysis = json.loads(content)
+                            content = json_match.group(1)
+                        else:
+                            # Method 2: Find JSON object directly (greedy match)
+                            json_match = _LLM_JSON_OBJ_RE.search(content)
+                            if json_match:
+                                content = json_match.group(0)
+                        
+                        llm_analysis = json.loads(content)
                     
                     # Update repository analysis with LLM insights
                     if llm_analysis.get('confidence_score', 0) > 70:  # Only use if confidence is high
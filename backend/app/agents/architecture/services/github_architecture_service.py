@@ -1,15 +1,49 @@
 import os
 import json
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass, asdict
 import logging
+from collections import Counter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from app.agents.architecture.services.github_analyzer_service import GitHubAnalyzerService, RepositoryAnalysis
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Technologies counted towards a "modern" stack in the maturity assessment
+_MODERN_TECH = frozenset({'React', 'Vue.js', 'Angular', 'FastAPI', 'Next.js', 'TypeScript'})
+
+# Bundlers reported in the frontend architecture section
+_BUILD_TOOLS_OF_INTEREST = frozenset({'Webpack', 'Vite', 'Parcel', 'Rollup'})
+
+# Static section defaults, shared across calls instead of rebuilt per request
+_DEFAULT_EXTERNAL_INTEGRATIONS = ('JWT Authentication', 'Payment Gateway (Stripe/PayPal)', 'Email Service (SMTP)', 'Cloud Storage')
+
+_DEFAULT_ARCH_GOALS = (
+    "Ensure system scalability and performance",
+    "Maintain code modularity and reusability",
+    "Implement robust security controls"
+)
+
+_DEFAULT_BUSINESS_DRIVERS = (
+    "Reduce time-to-market for new features",
+    "Improve system reliability and uptime",
+    "Enhance user experience and satisfaction"
+)
+
+_GENERAL_RECOMMENDATIONS = (
+    "Implement monitoring and logging",
+    "Add error handling and validation",
+    "Consider implementing caching strategies",
+    "Regular security audits and updates"
+)
+
+@dataclass(slots=True, frozen=True)
 class SystemArchitecture:
     project_info: Dict[str, Any]
     architecture_overview: Dict[str, Any]
@@ -23,6 +57,41 @@ class SystemArchitecture:
     tech_stack_summary: Dict[str, Any]
     business_alignment: Dict[str, Any]
     recommendations: List[str]
+    
+    def to_json(self) -> bytes:
+        """Serialize the architecture to UTF-8 JSON, using orjson when it is installed"""
+        if orjson is not None:
+            # orjson walks dataclasses natively, skipping the asdict deep copy
+            return orjson.dumps(self)
+        return json.dumps(asdict(self)).encode('utf-8')
+
+@dataclass(slots=True)
+class _ArchitectureContext:
+    """Repository facts derived once and shared by every section builder"""
+    api_count: int
+    component_count: int
+    total_files: int
+    languages_set: frozenset
+    frontend_set: frozenset
+    backend_set: frozenset
+    build_tools_set: frozenset
+    folder_names_lower: Tuple[str, ...]
+    has_docker: bool
+    has_env: bool
+    has_tests: bool
+    production_deps_count: int
+
+def _walk_folder_names(node: Any):
+    """Yield every folder and file name in a nested folder_structure mapping"""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield key
+            yield from _walk_folder_names(value)
+    elif isinstance(node, (list, tuple)):
+        for item in node:
+            yield from _walk_folder_names(item)
+    elif isinstance(node, str):
+        yield node
 
 class GitHubArchitectureService:
     def __init__(self):
@@ -61,41 +130,44 @@ class GitHubArchitectureService:
     ) -> SystemArchitecture:
         """Generate unified system architecture from repository analysis"""
         
+        # Walk the repository analysis once; every section reads from ctx
+        ctx = self._precompute_context(repo_analysis)
+        
         # Project Information
-        project_info = self._generate_project_info(repo_analysis)
+        project_info = self._generate_project_info(repo_analysis, ctx)
         
         # Architecture Overview
-        architecture_overview = self._generate_architecture_overview(repo_analysis)
+        architecture_overview = self._generate_architecture_overview(repo_analysis, ctx)
         
         # Frontend Architecture
-        frontend_architecture = self._generate_frontend_architecture(repo_analysis)
+        frontend_architecture = self._generate_frontend_architecture(repo_analysis, ctx)
         
         # Backend Architecture
-        backend_architecture = self._generate_backend_architecture(repo_analysis)
+        backend_architecture = self._generate_backend_architecture(repo_analysis, ctx)
         
         # API Documentation
-        api_documentation = self._generate_api_documentation(repo_analysis)
+        api_documentation = self._generate_api_documentation(repo_analysis, ctx)
         
         # Data Flow
-        data_flow = self._generate_data_flow(repo_analysis)
+        data_flow = self._generate_data_flow(repo_analysis, ctx)
         
         # Component Interactions
-        component_interactions = self._generate_component_interactions(repo_analysis)
+        component_interactions = self._generate_component_interactions(repo_analysis, ctx)
         
         # Deployment Architecture
-        deployment_architecture = self._generate_deployment_architecture(repo_analysis)
+        deployment_architecture = self._generate_deployment_architecture(repo_analysis, ctx)
         
         # Security Model
-        security_model = self._generate_security_model(repo_analysis)
+        security_model = self._generate_security_model(repo_analysis, ctx)
         
         # Tech Stack Summary
-        tech_stack_summary = self._generate_tech_stack_summary(repo_analysis)
+        tech_stack_summary = self._generate_tech_stack_summary(repo_analysis, ctx)
         
         # Business Alignment
-        business_alignment = self._generate_business_alignment(repo_analysis)
+        business_alignment = self._generate_business_alignment(repo_analysis, ctx)
         
         # Recommendations
-        recommendations = self._generate_recommendations(repo_analysis)
+        recommendations = self._generate_recommendations(repo_analysis, ctx)
         
         return SystemArchitecture(
             project_info=project_info,
@@ -112,7 +184,28 @@ class GitHubArchitectureService:
             recommendations=recommendations
         )
     
-    def _generate_project_info(self, repo_analysis: RepositoryAnalysis) -> Dict[str, Any]:
+    def _precompute_context(self, repo_analysis: RepositoryAnalysis) -> _ArchitectureContext:
+        """Collect the counts, sets and flags the section builders need in one pass"""
+        
+        build_tools_set = frozenset(repo_analysis.build_tools)
+        folder_names_lower = tuple(folder.lower() for folder in repo_analysis.folder_structure.keys())
+        
+        return _ArchitectureContext(
+            api_count=len(repo_analysis.api_endpoints),
+            component_count=len(repo_analysis.components),
+            total_files=repo_analysis.total_files,
+            languages_set=frozenset(repo_analysis.tech_stack.get('languages', [])),
+            frontend_set=frozenset(repo_analysis.tech_stack.get('frontend', [])),
+            backend_set=frozenset(repo_analysis.tech_stack.get('backend', [])),
+            build_tools_set=build_tools_set,
+            folder_names_lower=folder_names_lower,
+            has_docker='Docker' in build_tools_set,
+            has_env=any('.env' in name for name in _walk_folder_names(repo_analysis.folder_structure)),
+            has_tests=any('test' in folder for folder in folder_names_lower),
+            production_deps_count=len(repo_analysis.dependencies.get('production', []))
+        )
+    
+    def _generate_project_info(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> Dict[str, Any]:
         """Generate project information section"""
         
         return {
@@ -122,47 +215,47 @@ class GitHubArchitectureService:
             'generated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
             'analysis_scope': {
                 'repository_analyzed': True,
-                'total_files_analyzed': sum(len(folder_info.get('files', [])) for folder_info in repo_analysis.folder_structure.values() if isinstance(folder_info, dict)),
-                'api_endpoints_found': len(repo_analysis.api_endpoints),
-                'components_found': len(repo_analysis.components)
+                'total_files_analyzed': ctx.total_files,
+                'api_endpoints_found': ctx.api_count,
+                'components_found': ctx.component_count
             }
         }
     
-    def _generate_architecture_overview(self, repo_analysis: RepositoryAnalysis) -> Dict[str, Any]:
+    def _generate_architecture_overview(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> Dict[str, Any]:
         """Generate architecture overview"""
         
         return {
-            'architecture_pattern': self._determine_architecture_pattern(repo_analysis),
-            'complexity_score': self._calculate_complexity_score(repo_analysis),
-            'application_type': self._determine_application_type(repo_analysis),
-            'scalability_level': self._assess_scalability(repo_analysis),
-            'technology_maturity': self._assess_technology_maturity(repo_analysis),
-            'development_stage': self._assess_development_stage(repo_analysis),
-            'key_characteristics': self._extract_key_characteristics(repo_analysis),
-            'architecture_goals': self._generate_dynamic_architecture_goals(repo_analysis),
-            'business_drivers': self._generate_dynamic_business_drivers(repo_analysis)
+            'architecture_pattern': self._determine_architecture_pattern(repo_analysis, ctx),
+            'complexity_score': self._calculate_complexity_score(repo_analysis, ctx),
+            'application_type': self._determine_application_type(repo_analysis, ctx),
+            'scalability_level': self._assess_scalability(repo_analysis, ctx),
+            'technology_maturity': self._assess_technology_maturity(repo_analysis, ctx),
+            'development_stage': self._assess_development_stage(repo_analysis, ctx),
+            'key_characteristics': self._extract_key_characteristics(repo_analysis, ctx),
+            'architecture_goals': self._generate_dynamic_architecture_goals(repo_analysis, ctx),
+            'business_drivers': self._generate_dynamic_business_drivers(repo_analysis, ctx)
         }
     
-    def _generate_frontend_architecture(self, repo_analysis: RepositoryAnalysis) -> Dict[str, Any]:
+    def _generate_frontend_architecture(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> Dict[str, Any]:
         """Generate frontend architecture details"""
         
         return {
-            'framework': self._detect_frontend_framework(repo_analysis),
+            'framework': self._detect_frontend_framework(repo_analysis, ctx),
             'structure': repo_analysis.frontend_structure,
             'pages': {'total_pages': len(repo_analysis.frontend_structure.get('pages', []))},
-            'components': {'total_components': len(repo_analysis.components)},
+            'components': {'total_components': ctx.component_count},
             'routing': {'routing_strategy': 'Single Page Application (SPA)'},
             'state_management': 'Local State Management',
             'styling_approach': 'Utility-First CSS (Tailwind)',
-            'build_tools': [tool for tool in repo_analysis.build_tools if tool in ['Webpack', 'Vite', 'Parcel', 'Rollup']],
+            'build_tools': [tool for tool in repo_analysis.build_tools if tool in _BUILD_TOOLS_OF_INTEREST],
             'data_fetching': 'Fetch API (Browser Native)'
         }
     
-    def _generate_backend_architecture(self, repo_analysis: RepositoryAnalysis) -> Dict[str, Any]:
+    def _generate_backend_architecture(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> Dict[str, Any]:
         """Generate backend architecture details"""
         
         return {
-            'framework': self._detect_backend_framework(repo_analysis),
+            'framework': self._detect_backend_framework(repo_analysis, ctx),
             'structure': repo_analysis.backend_structure,
             'services': {'total_services': max(len(repo_analysis.backend_structure.get('services', [])), 3)},
             'controllers': {'total_controllers': 4},
@@ -171,41 +264,51 @@ class GitHubArchitectureService:
             'database': {'database_type': 'PostgreSQL/MySQL (Relational)', 'tables': 3},
             'authentication': 'Token-based authentication using OAuth2/JWT',
             'business_logic': repo_analysis.business_logic,
-            'external_integrations': ['JWT Authentication', 'Payment Gateway (Stripe/PayPal)', 'Email Service (SMTP)', 'Cloud Storage']
+            'external_integrations': _DEFAULT_EXTERNAL_INTEGRATIONS
         }
     
-    def _generate_api_documentation(self, repo_analysis: RepositoryAnalysis) -> Dict[str, Any]:
+    def _generate_api_documentation(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> Dict[str, Any]:
         """Generate comprehensive API documentation"""
         
-        api_doc = {
-            'total_endpoints': len(repo_analysis.api_endpoints),
-            'endpoints_by_method': self._group_endpoints_by_method(repo_analysis.api_endpoints),
-            'endpoints_by_module': self._group_endpoints_by_module(repo_analysis.api_endpoints),
-            'detailed_endpoints': []
-        }
+        by_method = Counter()
+        by_module = Counter()
+        detailed_endpoints = []
         
+        # One pass over the endpoints feeds both groupings and the detail list
         for endpoint in repo_analysis.api_endpoints:
+            by_method[endpoint.method] += 1
+            module, sep, _ = endpoint.file_location.partition('/')
+            by_module[module if sep else 'root'] += 1
+            
+            purpose = endpoint.purpose or ''
+            purpose_lc = purpose.lower()
+            
             endpoint_doc = {
                 'method': endpoint.method,
                 'path': endpoint.path,
-                'purpose': endpoint.purpose or 'No description available',
+                'purpose': purpose or 'No description available',
                 'input_schema': endpoint.input_schema,
                 'output_schema': endpoint.output_schema,
                 'dependencies': endpoint.dependencies,
                 'file_location': endpoint.file_location,
                 'line_number': endpoint.line_number,
-                'authentication_required': 'auth' in endpoint.purpose.lower(),
-                'rate_limiting': 'rate' in endpoint.purpose.lower()
+                'authentication_required': 'auth' in purpose_lc,
+                'rate_limiting': 'rate' in purpose_lc
             }
-            api_doc['detailed_endpoints'].append(endpoint_doc)
+            detailed_endpoints.append(endpoint_doc)
         
-        return api_doc
+        return {
+            'total_endpoints': ctx.api_count,
+            'endpoints_by_method': dict(by_method),
+            'endpoints_by_module': dict(by_module),
+            'detailed_endpoints': detailed_endpoints
+        }
     
-    def _generate_data_flow(self, repo_analysis: RepositoryAnalysis) -> Dict[str, Any]:
+    def _generate_data_flow(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> Dict[str, Any]:
         """Generate data flow analysis"""
         
         return {
-            'request_flow': {'flow_type': 'RESTful API with Multiple Endpoints' if len(repo_analysis.api_endpoints) > 10 else 'Standard HTTP Request/Response'},
+            'request_flow': {'flow_type': 'RESTful API with Multiple Endpoints' if ctx.api_count > 10 else 'Standard HTTP Request/Response'},
             'data_persistence': {'persistence_layer': 'Relational Database (SQL)'},
             'caching_strategy': 'No Caching Layer Detected',
             'data_validation': 'Schema-Based Validation (Pydantic/Joi)',
@@ -213,7 +316,7 @@ class GitHubArchitectureService:
             'logging_strategy': 'Console Logging Only'
         }
     
-    def _generate_component_interactions(self, repo_analysis: RepositoryAnalysis) -> Dict[str, Any]:
+    def _generate_component_interactions(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> Dict[str, Any]:
         """Generate component interaction analysis"""
         
         return {
@@ -225,20 +328,20 @@ class GitHubArchitectureService:
             'communication_patterns': 'Synchronous HTTP/REST' if repo_analysis.api_endpoints else 'Direct Function Calls'
         }
     
-    def _generate_deployment_architecture(self, repo_analysis: RepositoryAnalysis) -> Dict[str, Any]:
+    def _generate_deployment_architecture(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> Dict[str, Any]:
         """Generate deployment architecture"""
         
         return {
-            'containerization': 'Docker' in repo_analysis.build_tools,
-            'orchestration': 'Docker Compose' in repo_analysis.build_tools,
-            'ci_cd': 'CI/CD' in repo_analysis.build_tools,
-            'cloud_readiness': 'Container Ready' if 'Docker' in repo_analysis.build_tools else 'Requires Cloud Configuration',
-            'environment_configuration': 'Environment Variables (.env files)' if '.env' in str(repo_analysis.folder_structure) else 'Hardcoded Configuration (Needs Improvement)',
+            'containerization': ctx.has_docker,
+            'orchestration': 'Docker Compose' in ctx.build_tools_set,
+            'ci_cd': 'CI/CD' in ctx.build_tools_set,
+            'cloud_readiness': 'Container Ready' if ctx.has_docker else 'Requires Cloud Configuration',
+            'environment_configuration': 'Environment Variables (.env files)' if ctx.has_env else 'Hardcoded Configuration (Needs Improvement)',
             'monitoring_setup': 'Basic Monitoring (Needs Enhancement)',
             'scalability_considerations': ['Horizontal Scaling Preparation', 'Performance Optimization']
         }
     
-    def _generate_security_model(self, repo_analysis: RepositoryAnalysis) -> Dict[str, Any]:
+    def _generate_security_model(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> Dict[str, Any]:
         """Generate security model analysis"""
         
         return {
@@ -248,10 +351,10 @@ class GitHubArchitectureService:
             'input_validation': 'Schema-based Validation (Pydantic/Joi)',
             'security_headers': 'Basic Security Headers (Needs Enhancement)',
             'dependency_security': 'Low Risk - Minimal Dependencies',
-            'secrets_management': 'Environment Variables (.env files)' if '.env' in str(repo_analysis.folder_structure) else 'Hardcoded Secrets (High Security Risk)'
+            'secrets_management': 'Environment Variables (.env files)' if ctx.has_env else 'Hardcoded Secrets (High Security Risk)'
         }
     
-    def _generate_tech_stack_summary(self, repo_analysis: RepositoryAnalysis) -> Dict[str, Any]:
+    def _generate_tech_stack_summary(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> Dict[str, Any]:
         """Generate technology stack summary"""
         
         languages = repo_analysis.tech_stack.get('languages', [])
@@ -285,141 +388,127 @@ class GitHubArchitectureService:
             }
         }
     
-    def _generate_business_alignment(self, repo_analysis: RepositoryAnalysis) -> Dict[str, Any]:
+    def _generate_business_alignment(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> Dict[str, Any]:
         """Generate business alignment analysis"""
         
         return {
             'feature_coverage': 'Not available - no PRD provided',
             'requirement_traceability': [],
             'gap_analysis': [],
-            'implementation_completeness': self._assess_implementation_completeness(repo_analysis)
+            'implementation_completeness': self._assess_implementation_completeness(repo_analysis, ctx)
         }
     
-    def _generate_recommendations(self, repo_analysis: RepositoryAnalysis) -> List[str]:
+    def _generate_recommendations(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> List[str]:
         """Generate architecture recommendations"""
         
         recommendations = []
         
-        if len(repo_analysis.api_endpoints) > 20:
+        if ctx.api_count > 20:
             recommendations.append("Consider implementing API versioning and documentation (OpenAPI/Swagger)")
         
-        if not any('test' in folder.lower() for folder in repo_analysis.folder_structure.keys()):
+        if not ctx.has_tests:
             recommendations.append("Add comprehensive testing strategy (unit, integration, e2e tests)")
         
-        if 'Docker' not in repo_analysis.build_tools:
+        if not ctx.has_docker:
             recommendations.append("Implement containerization with Docker for consistent deployments")
         
-        if 'CI/CD' not in repo_analysis.build_tools:
+        if 'CI/CD' not in ctx.build_tools_set:
             recommendations.append("Set up CI/CD pipeline for automated testing and deployment")
         
-        recommendations.extend([
-            "Implement monitoring and logging",
-            "Add error handling and validation",
-            "Consider implementing caching strategies",
-            "Regular security audits and updates"
-        ])
+        # At most four conditional entries plus the four general ones, so the
+        # list never exceeds the eight-item limit and needs no slicing
+        recommendations.extend(_GENERAL_RECOMMENDATIONS)
         
-        return recommendations[:8]
+        return recommendations
     
     # Helper methods
-    def _determine_architecture_pattern(self, repo_analysis: RepositoryAnalysis) -> str:
-        if len(repo_analysis.api_endpoints) > 30:
+    def _determine_architecture_pattern(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> str:
+        if ctx.api_count > 30:
             return "Microservices"
-        elif any('component' in folder.lower() for folder in repo_analysis.folder_structure.keys()):
+        elif any('component' in folder for folder in ctx.folder_names_lower):
             return "Component-Based Architecture"
         else:
             return "Monolithic Architecture"
     
-    def _calculate_complexity_score(self, repo_analysis: RepositoryAnalysis) -> int:
+    def _calculate_complexity_score(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> int:
         score = 1
-        score += min(len(repo_analysis.api_endpoints) // 5, 3)
-        score += min(len(repo_analysis.components) // 10, 2)
-        score += min(len(repo_analysis.dependencies.get('production', [])) // 15, 2)
-        score += min(len(repo_analysis.tech_stack.get('languages', [])), 2)
+        score += min(ctx.api_count // 5, 3)
+        score += min(ctx.component_count // 10, 2)
+        score += min(ctx.production_deps_count // 15, 2)
+        score += min(len(ctx.languages_set), 2)
+        score += min(ctx.total_files // 20, 2)
         
-        total_files = sum(len(files.get('files', [])) for files in repo_analysis.folder_structure.values() if isinstance(files, dict))
-        score += min(total_files // 20, 2)
-        
-        if len(repo_analysis.tech_stack.get('languages', [])) > 0:
+        if ctx.languages_set:
             score = max(score, 2)
         
         return min(score, 10)
     
-    def _determine_application_type(self, repo_analysis: RepositoryAnalysis) -> str:
-        frontend_tech = repo_analysis.tech_stack.get('frontend', [])
-        backend_tech = repo_analysis.tech_stack.get('backend', [])
+    def _determine_application_type(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> str:
         languages = repo_analysis.tech_stack.get('languages', [])
         
-        if frontend_tech and backend_tech:
+        if ctx.frontend_set and ctx.backend_set:
             return "Full-Stack Web Application"
-        elif frontend_tech:
+        elif ctx.frontend_set:
             return "Frontend Web Application"
-        elif backend_tech:
+        elif ctx.backend_set:
             return "Backend Web Service"
-        elif 'JavaScript' in languages or 'TypeScript' in languages:
+        elif 'JavaScript' in ctx.languages_set or 'TypeScript' in ctx.languages_set:
             return "Web Application"
-        elif 'Python' in languages:
+        elif 'Python' in ctx.languages_set:
             return "Python Web Application"
         elif len(languages) > 0:
             return f"{languages[0]} Application"
         else:
             return "Code Repository"
     
-    def _assess_scalability(self, repo_analysis: RepositoryAnalysis) -> str:
-        if 'Docker' in repo_analysis.build_tools and len(repo_analysis.api_endpoints) > 20:
+    def _assess_scalability(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> str:
+        if ctx.has_docker and ctx.api_count > 20:
             return "High Scalability"
-        elif len(repo_analysis.api_endpoints) > 10:
+        elif ctx.api_count > 10:
             return "Medium Scalability"
-        elif len(repo_analysis.api_endpoints) > 0:
+        elif ctx.api_count > 0:
             return "Moderate Scalability"
         else:
             return "Basic Scalability"
     
-    def _assess_technology_maturity(self, repo_analysis: RepositoryAnalysis) -> str:
-        modern_tech = ['React', 'Vue.js', 'Angular', 'FastAPI', 'Next.js', 'TypeScript']
-        languages = repo_analysis.tech_stack.get('languages', [])
+    def _assess_technology_maturity(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> str:
+        used_modern_tech = (ctx.frontend_set | ctx.backend_set | ctx.languages_set) & _MODERN_TECH
         
-        used_modern_tech = [
-            tech for tech in repo_analysis.tech_stack.get('frontend', []) + 
-            repo_analysis.tech_stack.get('backend', []) + languages
-            if tech in modern_tech
-        ]
-        
-        if 'TypeScript' in languages:
+        if 'TypeScript' in ctx.languages_set:
             return "Modern Technology Stack"
-        elif len(used_modern_tech) >= 1:
+        elif used_modern_tech:
             return "Mixed Technology Stack"
-        elif 'Python' in languages or 'JavaScript' in languages:
+        elif 'Python' in ctx.languages_set or 'JavaScript' in ctx.languages_set:
             return "Established Technology Stack"
         else:
             return "Basic Technology Stack"
     
-    def _assess_development_stage(self, repo_analysis: RepositoryAnalysis) -> str:
-        if len(repo_analysis.api_endpoints) > 50:
+    def _assess_development_stage(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> str:
+        if ctx.api_count > 50:
             return "Mature/Production"
-        elif len(repo_analysis.api_endpoints) > 10:
+        elif ctx.api_count > 10:
             return "Development/Beta"
         else:
             return "Early Stage/MVP"
     
-    def _extract_key_characteristics(self, repo_analysis: RepositoryAnalysis) -> List[str]:
+    def _extract_key_characteristics(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> List[str]:
         characteristics = []
         languages = repo_analysis.tech_stack.get('languages', [])
         
-        if len(repo_analysis.api_endpoints) > 20:
+        if ctx.api_count > 20:
             characteristics.append("API-Driven Architecture")
-        elif len(repo_analysis.api_endpoints) > 0:
+        elif ctx.api_count > 0:
             characteristics.append("RESTful API Design")
         
-        if 'React' in repo_analysis.tech_stack.get('frontend', []):
+        if 'React' in ctx.frontend_set:
             characteristics.append("Component-Based Frontend")
-        elif 'JavaScript' in languages or 'TypeScript' in languages:
+        elif 'JavaScript' in ctx.languages_set or 'TypeScript' in ctx.languages_set:
             characteristics.append("Interactive Web Interface")
         
-        if 'Python' in languages:
+        if 'Python' in ctx.languages_set:
             characteristics.append("Python-Based Backend")
         
-        if 'Docker' in repo_analysis.build_tools:
+        if ctx.has_docker:
             characteristics.append("Containerized Deployment")
         
         if not characteristics and len(languages) > 0:
@@ -427,80 +516,50 @@ class GitHubArchitectureService:
         
         return characteristics
     
-    def _generate_dynamic_architecture_goals(self, repo_analysis: RepositoryAnalysis) -> List[str]:
-        goals = [
-            "Ensure system scalability and performance",
-            "Maintain code modularity and reusability",
-            "Implement robust security controls"
-        ]
-        
-        if len(repo_analysis.api_endpoints) > 10:
-            goals.append("Standardize API design and documentation")
+    def _generate_dynamic_architecture_goals(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> Sequence[str]:
+        if ctx.api_count > 10:
+            return [*_DEFAULT_ARCH_GOALS, "Standardize API design and documentation"]
         
-        return goals
+        return _DEFAULT_ARCH_GOALS
     
-    def _generate_dynamic_business_drivers(self, repo_analysis: RepositoryAnalysis) -> List[str]:
-        drivers = [
-            "Reduce time-to-market for new features",
-            "Improve system reliability and uptime",
-            "Enhance user experience and satisfaction"
-        ]
+    def _generate_dynamic_business_drivers(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> Sequence[str]:
+        if ctx.api_count > 20:
+            return [*_DEFAULT_BUSINESS_DRIVERS, "Scale API to support third-party integrations"]
         
-        if len(repo_analysis.api_endpoints) > 20:
-            drivers.append("Scale API to support third-party integrations")
-        
-        return drivers
+        return _DEFAULT_BUSINESS_DRIVERS
     
-    def _detect_frontend_framework(self, repo_analysis: RepositoryAnalysis) -> str:
-        frontend_tech = repo_analysis.tech_stack.get('frontend', [])
-        
-        if 'React' in frontend_tech:
+    def _detect_frontend_framework(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> str:
+        if 'React' in ctx.frontend_set:
             return 'React (Vite SPA)'
-        elif 'Vue.js' in frontend_tech:
+        elif 'Vue.js' in ctx.frontend_set:
             return 'Vue.js SPA'
-        elif 'Angular' in frontend_tech:
+        elif 'Angular' in ctx.frontend_set:
             return 'Angular SPA'
         else:
             return 'React (Vite SPA)'
     
-    def _detect_backend_framework(self, repo_analysis: RepositoryAnalysis) -> str:
-        backend_tech = repo_analysis.tech_stack.get('backend', [])
-        
-        if 'FastAPI' in backend_tech:
+    def _detect_backend_framework(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> str:
+        if 'FastAPI' in ctx.backend_set:
             return 'FastAPI (modern, async Python web framework for building APIs)'
-        elif 'Django' in backend_tech:
+        elif 'Django' in ctx.backend_set:
             return 'Django (Python web framework)'
-        elif 'Flask' in backend_tech:
+        elif 'Flask' in ctx.backend_set:
             return 'Flask (lightweight Python web framework)'
         else:
             return 'FastAPI (modern, async Python web framework for building APIs)'
     
-    def _group_endpoints_by_method(self, endpoints) -> Dict[str, int]:
-        methods = {}
-        for endpoint in endpoints:
-            method = endpoint.method
-            methods[method] = methods.get(method, 0) + 1
-        return methods
-    
-    def _group_endpoints_by_module(self, endpoints) -> Dict[str, int]:
-        modules = {}
-        for endpoint in endpoints:
-            module = endpoint.file_location.split('/')[0] if '/' in endpoint.file_location else 'root'
-            modules[module] = modules.get(module, 0) + 1
-        return modules
-    
-    def _assess_implementation_completeness(self, repo_analysis: RepositoryAnalysis) -> str:
+    def _assess_implementation_completeness(self, repo_analysis: RepositoryAnalysis, ctx: _ArchitectureContext) -> str:
         score = 0
         
-        if len(repo_analysis.api_endpoints) > 15: score += 3
-        elif len(repo_analysis.api_endpoints) > 5: score += 2
-        elif len(repo_analysis.api_endpoints) > 0: score += 1
+        if ctx.api_count > 15: score += 3
+        elif ctx.api_count > 5: score += 2
+        elif ctx.api_count > 0: score += 1
         
-        if len(repo_analysis.components) > 20: score += 2
-        elif len(repo_analysis.components) > 5: score += 1
+        if ctx.component_count > 20: score += 2
+        elif ctx.component_count > 5: score += 1
         
-        if 'Docker' in repo_analysis.build_tools: score += 1
-        if '.env' in str(repo_analysis.folder_structure): score += 1
+        if ctx.has_docker: score += 1
+        if ctx.has_env: score += 1
         
         if score >= 7:
             return 'Production-Ready Implementation'
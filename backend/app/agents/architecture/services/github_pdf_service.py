@@ -1,12 +1,24 @@
 import os
+import copy
+import hashlib
 import json
+import multiprocessing
 import re
-from typing import Dict, List, Any
+import tempfile
+import posixpath
+import zipfile
+from typing import TYPE_CHECKING, Dict, List, Any, Tuple, Optional, Iterable, Iterator
+from collections import Counter, defaultdict
+from contextlib import closing
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, white
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 import logging
 from xml.sax.saxutils import escape
@@ -18,6 +30,11 @@ try:
 except ImportError:
     Document = None
 
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
 try:
     import PyPDF2
 except ImportError:
@@ -33,6 +50,16 @@ try:
 except ImportError:
     pdfplumber = None
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 try:
     import openpyxl
 except ImportError:
@@ -43,56 +70,607 @@ try:
 except ImportError:
     pd = None
 
+try:
+    from charset_normalizer import from_bytes as detect_charset
+except ImportError:
+    detect_charset = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+
 from app.agents.architecture.services.github_architecture_service import SystemArchitecture
-from app.agents.architecture.services.diagram_generator import ArchitectureDiagramGenerator
-from app.agents.architecture.services.layered_diagram_generator import LayeredDataFlowGenerator
+# The diagram generators pull in matplotlib, so they are imported when the first diagram is rendered
+if TYPE_CHECKING:
+    from app.agents.architecture.services.diagram_generator import ArchitectureDiagramGenerator
 
 logger = logging.getLogger(__name__)
 
-class MockRepoAnalysis:
-    """Mock repository analysis object for diagram generation"""
-    def __init__(self, repo_data):
-        self.tech_stack = {
-            'frontend': repo_data.get('frontend_tech', []),
-            'backend': repo_data.get('backend_tech', []),
-            'languages': list(repo_data.get('languages', {}).keys()),
-            'database': repo_data.get('database_tech', [])
-        }
-        self.api_endpoints = repo_data.get('api_endpoints', [])
-        self.components = [f"Component_{i}" for i in range(repo_data.get('components_total', 0))]
-        self.backend_structure = {'services': []}
-        self.business_logic = []
-        self.dependencies = {'production': []}
+# Number of parsed PRDs kept per service instance
+_PRD_CACHE_SIZE = 16
+# Number of endpoint inventories kept per service instance, keyed by a digest of their inputs
+_ENDPOINT_CACHE_SIZE = 16
+# Number of rendered diagram paths remembered per service instance
+_DIAGRAM_CACHE_SIZE = 32
+# Diagrams are rendered at 300 dpi; they are embedded as JPEGs downscaled to this resolution at their drawn size
+_DIAGRAM_EMBED_DPI = 150
+_DIAGRAM_JPEG_QUALITY = 85
+
+# Patterns used by _clean_extracted_text, compiled once at import
+_RE_PDF_HDR = re.compile(r'%PDF-.*?(\n\n|\n[A-Z])', re.DOTALL)
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+# Runs of whitespace and non-ASCII characters, each collapsed to a single space
+_RE_GAP = re.compile(r'[^\x21-\x7E•]+')
+
+# ASCII control bytes that cause paraparser errors; single bytes in UTF-8, so safe to drop before decoding
+_CTRL_BYTES = bytes([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+
+# Problematic Unicode characters and their ASCII-safe replacements, applied in one translate pass
+_UNICODE_REPLACEMENTS = str.maketrans({
+    '\u2018': "'",  # Left single quote
+    '\u2019': "'",  # Right single quote
+    '\u201c': '"',  # Left double quote
+    '\u201d': '"',  # Right double quote
+    '\u2013': '-',  # En dash
+    '\u2014': '--', # Em dash
+    '\u2026': '...', # Ellipsis
+    '\u00a0': ' ',  # Non-breaking space
+    '\u00b0': ' degrees',  # Degree symbol
+    '\u2022': '•',  # Bullet point
+    '\u00ae': '(R)', # Registered trademark
+    '\u00a9': '(C)', # Copyright
+    '\u2122': '(TM)', # Trademark
+})
+# Binary/control characters that cause paraparser errors are dropped in the same pass
+_UNICODE_REPLACEMENTS.update(dict.fromkeys([*_CTRL_BYTES, *range(0x80, 0xA0)]))
+
+# HTML entities decoded in a single regex pass
+_HTML_ENTITIES = {
+    '&quot;': '"',  # HTML encoded quote
+    '&amp;': '&',   # HTML encoded ampersand
+    '&lt;': '<',    # HTML encoded less than
+    '&gt;': '>',    # HTML encoded greater than
+    '&nbsp;': ' ',  # HTML non-breaking space
+}
+_RE_HTML_ENTITY = re.compile('|'.join(map(re.escape, _HTML_ENTITIES)))
+
+# WordprocessingML tags read by _extract_word_text
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY, _W_P, _W_TBL, _W_TR, _W_TC = (_W_NS + tag for tag in ('body', 'p', 'tbl', 'tr', 'tc'))
+_W_T, _W_BR, _W_BR_TYPE = _W_NS + 't', _W_NS + 'br', _W_NS + 'type'
+_W_RUN_CHARS = {_W_NS + 'tab': '\t', _W_NS + 'ptab': '\t', _W_NS + 'cr': '\n', _W_NS + 'noBreakHyphen': '-'}
+_W_RUNS_XPATH = 'w:r | w:hyperlink/w:r'
+_W_NSMAP = {'w': _W_NS[1:-1]}
+
+# PresentationML/DrawingML tags read by _extract_powerpoint_text
+_P_NS = '{http://schemas.openxmlformats.org/presentationml/2006/main}'
+_A_NS = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+_P_SLIDE_IDS = f'{_P_NS}sldIdLst/{_P_NS}sldId'
+_P_SHAPES = f'{_P_NS}cSld/{_P_NS}spTree/{_P_NS}sp'
+_P_PARAGRAPHS = f'{_P_NS}txBody/{_A_NS}p'
+_A_T, _A_BR = _A_NS + 't', _A_NS + 'br'
+_A_TEXT_NODES = frozenset({_A_NS + 'r', _A_NS + 'fld', _A_BR})
+_R_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+
+# Patterns used by _extract_entities_from_prd
+_ENTITY_SCHEMA_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:Table|Entity)\s+([A-Za-z]+)\s+(?:Fields|Columns)',
+    r'([A-Za-z]+)\s+(?:table|entity)\s*:?\s*(?:Fields|Columns)',
+    r'\b([A-Z][a-z]+)\s+(?:user_id|hotel_id|room_id|booking_id)',  # Table with ID fields
+))
+_ENTITY_API_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'/(?:api/)?([a-zA-Z]+)(?:/|\s|$)',  # /api/users, /hotels
+    r'/auth/([a-zA-Z]+)',  # /auth/register, /auth/login
+))
+_ENTITY_API_STOPWORDS = frozenset({'api', 'auth', 'register', 'login'})
+
+# Technology keywords detected by parse_prd_content, indexed as {keyword: (category, display name)}
+_TECH_KEYWORDS = {
+    'languages': ['python', 'javascript', 'java', 'c#', 'csharp', 'php', 'ruby', 'go', 'rust', 'typescript', 'kotlin', 'swift', 'scala', 'clojure'],
+    'frontend': ['react', 'vue', 'angular', 'next.js', 'nextjs', 'nuxt', 'svelte', 'html', 'css', 'bootstrap', 'tailwind', 'material-ui', 'chakra'],
+    'backend': ['fastapi', 'flask', 'django', 'express', 'spring', 'laravel', 'rails', 'gin', 'actix', 'node.js', 'nodejs', 'asp.net', 'koa'],
+    'databases': ['postgresql', 'postgres', 'mysql', 'mongodb', 'redis', 'sqlite', 'oracle', 'cassandra', 'dynamodb', 'elasticsearch', 'mariadb']
+}
+_TECH_DISPLAY_NAMES = {
+    'nextjs': 'Next.js', 'nodejs': 'Node.js', 'csharp': 'C#',
+    'postgres': 'PostgreSQL', 'mongodb': 'MongoDB'
+}
+_TECH_LOOKUP = {
+    keyword: (category, _TECH_DISPLAY_NAMES.get(keyword, keyword.title()))
+    for category, keywords in _TECH_KEYWORDS.items()
+    for keyword in keywords
+}
+_TECH_TOKEN_RE = re.compile(r'[a-z0-9.#+\-]{2,}')
+_TECH_VERSION_CHARS = '0123456789.'
+
+def _tech_token_forms(token: str) -> Iterator[str]:
+    """Spellings of a PRD token to look up in _TECH_LOOKUP: as written, without a version or .js suffix, and per hyphenated part"""
+    token = token.strip('.-')
+    yield token
+    # html5, python3.11 -> html, python
+    unversioned = token.rstrip(_TECH_VERSION_CHARS)
+    yield unversioned
+    # react.js, vuejs -> react, vue
+    bare = unversioned.removesuffix('.js').removesuffix('js')
+    yield bare
+    # react-native, spring-boot -> react, spring
+    if '-' in bare:
+        yield from bare.split('-')
+# Fallback tables inferred from entity words when a PRD has no explicit schema, as {stem: table}
+_COMMON_ENTITY_STEMS = {
+    'user': 'users', 'room': 'rooms', 'booking': 'bookings',
+    'product': 'products', 'order': 'orders', 'customer': 'customers'
+}
+_RE_PRD_WORD = re.compile(r'[a-z]+')
+# Product name detection in _extract_enhanced_product_name
+_PRD_NAME_PREFIX_RE = re.compile(r'^[#*\-•\s]+')
+_PRD_NAME_CHAR_TABLE = str.maketrans({
+    **dict.fromkeys('„«»', '"'),
+    **dict.fromkeys('–—−', '-'),
+    **dict.fromkeys([*range(0x00, 0x20), *range(0x7F, 0xA0)], ' '),
+})
+_PRD_NAME_META_RE = re.compile(r'^(Page|Document|Version|Prepared|Table|Product Requirements|PRD|Contents?)\b', re.IGNORECASE)
+_PRD_NAME_TITLE_RE = re.compile(r'^[A-Z][a-zA-Z\s]+[A-Za-z]$')
+_PRD_NAME_NUMBER_RE = re.compile(r'^\d+\.?\s*$')
+# Application/system/platform keywords that indicate a title, matched against the lowered line
+_PRD_NAME_KEYWORD_RE = re.compile(
+    r'application|system|platform|app|service|portal|dashboard|management|booking|ecommerce|marketplace|api|website|tool|solution'
+)
+# Backend technologies named in a PRD, as {lowercase substring: display name}
+_PRD_BACKEND_TECH_KEYWORDS = {
+    'python': 'Python',
+    'fastapi': 'FastAPI',
+    'django': 'Django',
+    'flask': 'Flask',
+    'node': 'Node.js',
+    'express': 'Express.js',
+    'java': 'Java',
+    'spring': 'Spring Boot',
+    'go': 'Go',
+    'rust': 'Rust'
+}
+# Title detection in _extract_title_from_prd
+_PRD_TITLE_BULLET_RE = re.compile(r'^[#*\-•\s\d\.]+')
+_PRD_TITLE_SKIP_RE = re.compile(r'^(table of contents?|prepared by|document|version|date|author)', re.IGNORECASE)
+_PRD_TITLE_ALPHA_RE = re.compile(r'[a-zA-Z]')
+_PRD_TITLE_ARTIFACT_RE = re.compile(r'\b(prd|product requirements? document|requirements?)\b', re.IGNORECASE)
+# Explicit /api/... style paths mentioned anywhere in a PRD
+_PRD_EXPLICIT_PATH_RE = re.compile(r'/(?:api/)?([a-zA-Z/]+)')
+
+# Patterns used by parse_prd_content, _preprocess_prd_content and the _extract_enhanced_* helpers
+_PRD_USER_STORY_RE = re.compile(r'as a (?:user|admin|customer)[^\n]*?(?:want to|can)\s+([^\n\.]+)', re.IGNORECASE)
+_RE_PRD_BLANK_LINES = re.compile(r'\n\s*\n')
+# PDF headers and indirect object references, removed in one alternation pass
+_RE_PRD_PDF_NOISE = re.compile(r'%PDF-[\d\.]+.*?\n|/[A-Z][a-zA-Z]*\s+\d+\s+\d+\s+R', re.DOTALL)
+# PDF dictionaries and streams, removed with literal scans rather than lazy DOTALL regexes
+_PRD_ARTIFACT_DELIMITERS = (('<<', '>>'), ('stream', 'endstream'))
+# Clean up common document artifacts
+_RE_PRD_PAGE_FOOTER = re.compile(r'Page \d+ of \d+')
+# Single-character fixes applied last in one translate pass
+_PRD_PREPROCESS_TABLE = {
+    **dict.fromkeys([*range(0x00, 0x09), 0x0B, *range(0x0E, 0x20), *range(0x7F, 0xA0)]),  # Remove control characters
+    0x0C: '\n',  # Form feed to newline
+    **dict.fromkeys(range(0x2010, 0x2016), '-'),  # Normalize dashes
+}
+_PRD_BULLET_ITEM_RE = re.compile(r'(?:•|\*|-|\d+\.)\s*([^\n]+)')
+# Lines starting with a bullet character or item number followed by whitespace; group 1 is the item text
+_PRD_BULLET_LINE_RE = re.compile(r'^[^\S\n]*(?:[\u2022*+\-]|\d+\.)[^\S\n]+([^\n]*)', re.MULTILINE)
+_PRD_FEATURE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    r'(?:features?|functionality|capabilities)[:\s]*\n([\s\S]*?)(?:\n\n|\n[A-Z]|$)',
+    r'(?:key|core|main)\s+features?[:\s]*\n([\s\S]*?)(?:\n\n|\n[A-Z]|$)',
+    r'(?:requirements?|specifications?)[:\s]*\n([\s\S]*?)(?:\n\n|\n[A-Z]|$)',
+))
+_PRD_ACTION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:user can|users can|ability to|should be able to|will be able to)\s+([^\n\.]+)',
+    r'(?:the system|application|app)\s+(?:will|should|must|can)\s+([^\n\.]+)',
+))
+_PRD_HTTP_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(GET|POST|PUT|DELETE|PATCH)\s+(/[^\s\n]+)',
+    r'(GET|POST|PUT|DELETE|PATCH)[:\s]+([^\n]+)',
+    r'\b(GET|POST|PUT|DELETE|PATCH)\b[^\n]*(/api/[^\s\n]+)',
+))
+_PRD_ENDPOINT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:endpoint|api)[:\s]*([^\n]+)',
+    r'/api/[a-zA-Z0-9/_-]+',
+    r'(?:route|path)[:\s]*(/[^\s\n]+)',
+    r'\b(\w+)\s+endpoint',
+    r'\b(\w+)\s+API',
+    r'•\s*([^\n]*(?:endpoint|API|api)[^\n]*)',
+    r'-\s*([^\n]*(?:endpoint|API|api)[^\n]*)',
+    r'\d+\.\s*([^\n]*(?:endpoint|API|api)[^\n]*)',
+))
+# Keywords that imply an API, paired with the method description they produce
+_PRD_API_KEYWORD_METHODS = tuple((keyword, f"API for {keyword} functionality") for keyword in (
+    'login', 'register', 'authenticate', 'logout',
+    'user', 'profile', 'account',
+    'product', 'item', 'catalog',
+    'order', 'purchase', 'payment',
+    'cart', 'basket', 'checkout',
+    'search', 'filter', 'query',
+    'upload', 'download', 'file',
+    'data', 'information', 'record',
+))
+# Entities inferred as database tables when mentioned anywhere in a PRD
+_PRD_DB_ENTITIES = ('user', 'product', 'order', 'customer', 'item', 'category', 'payment', 'account')
+
+# API keywords, DB entities and backend tech names are matched as plain substrings; with pyahocorasick
+# installed all of them are found in one automaton pass instead of one scan per keyword
+_PRD_BACKEND_HINT_WORDS = ('api', 'backend', 'server', 'database')
+_PRD_SUBSTRING_KEYWORDS = (
+    frozenset(keyword for keyword, _ in _PRD_API_KEYWORD_METHODS)
+    | frozenset(_PRD_DB_ENTITIES)
+    | _PRD_BACKEND_TECH_KEYWORDS.keys()
+    | frozenset(_PRD_BACKEND_HINT_WORDS)
+)
+if ahocorasick is not None:
+    _PRD_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _PRD_SUBSTRING_KEYWORDS:
+        _PRD_KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _PRD_KEYWORD_AUTOMATON.make_automaton()
+else:
+    _PRD_KEYWORD_AUTOMATON = None
+
+# Numbered, bullet, dash and asterisk list items in one pass
+_PRD_LIST_ITEM_RE = re.compile(r'^[ \t]*(?:\d+\.|[•*\-])\s+([^\n]+)', re.MULTILINE)
+_PRD_LIST_API_WORDS = ('api', 'endpoint', 'service', 'function', 'method')
+_PRD_TABLE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:table|entity|model)[:\s]*([a-zA-Z_][a-zA-Z0-9_]*)',
+    r'(?:database|db)\s+(?:table|schema)[:\s]*([a-zA-Z_][a-zA-Z0-9_]*)',
+    r'CREATE\s+TABLE\s+([a-zA-Z_][a-zA-Z0-9_]*)',
+))
+_PRD_GOAL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    r'(?:goal|objective|purpose|aim)[s]?[:\s]*\n([\s\S]*?)(?:\n\n|\n[A-Z]|$)',
+    r'(?:mission|vision)[:\s]*([^\n\.]+)',
+))
+
+# File extension lookups shared by the folder-structure scans
+_LANGUAGE_BY_EXT = {
+    '.py': 'Python',
+    '.js': 'JavaScript', '.jsx': 'JavaScript', '.ts': 'JavaScript', '.tsx': 'JavaScript',
+    '.java': 'Java',
+}
+_FRONTEND_FILE_EXTS = frozenset({'.js', '.jsx', '.ts', '.tsx', '.vue'})
+_JS_FILE_EXTS = frozenset({'.js', '.jsx', '.ts', '.tsx'})
+# Files counted as frontend components by the repo metrics; '.component.ts' is covered by '.ts'
+_COMPONENT_FILE_EXTS = ('.jsx', '.tsx', '.vue', '.js', '.ts', '.html')
+_DETECTED_LANGUAGE_BY_EXT = {
+    '.py': 'Python',
+    '.js': 'JavaScript', '.jsx': 'JavaScript',
+    '.ts': 'TypeScript', '.tsx': 'TypeScript',
+    '.java': 'Java', '.go': 'Go', '.rs': 'Rust', '.php': 'PHP', '.rb': 'Ruby',
+    '.html': 'HTML/CSS', '.css': 'HTML/CSS',
+}
+# Well-known file names that reveal the backend stack
+_BACKEND_MARKER_FILES = {
+    'main.py': 'FastAPI/Flask', 'app.py': 'FastAPI/Flask', 'server.py': 'FastAPI/Flask',
+    'package.json': 'Node.js',
+    'pom.xml': 'Spring Boot', 'build.gradle': 'Spring Boot',
+    'requirements.txt': 'Python',
+}
+# HTTP methods counted as data flow operations by _analyze_system_flow
+_DATA_FLOW_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE'})
+_GENERIC_FRONTEND_FILES = frozenset({'app', 'index', 'main', 'component', 'utils', 'config'})
+_RE_NON_ALPHA = re.compile(r'[^a-zA-Z]')
+_RE_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\-_\.]')
+# Substring alternations used by the _has_*_indicators checks on lowered folder names and PRD text
+_FRONTEND_FOLDER_RE = re.compile(r'src|app|frontend|client|ui')
+_FRONTEND_ENTRY_FILES = frozenset({'index.html', 'package.json', 'index.js', 'App.js', 'main.js'})
+_BACKEND_FOLDER_RE = re.compile(r'api|server|backend|service')
+_API_FOLDER_RE = re.compile(r'api|routes|controllers')
+_BACKEND_PRD_RE = re.compile(r'api|backend|server|database|endpoint')
+_API_PRD_RE = re.compile(r'api|endpoint|rest|graphql')
+
+def _find_prd_keywords(text_lower: str) -> set:
+    """Return the _PRD_SUBSTRING_KEYWORDS that occur anywhere in already-lowered text"""
+    if _PRD_KEYWORD_AUTOMATON is not None:
+        return {keyword for _, keyword in _PRD_KEYWORD_AUTOMATON.iter(text_lower)}
+    return {keyword for keyword in _PRD_SUBSTRING_KEYWORDS if keyword in text_lower}
+
+def _unique_head(items: Iterable[str], limit: int) -> List[str]:
+    """First `limit` distinct items in their original order"""
+    return list(islice(dict.fromkeys(items), limit))
+
+def _derive_service(path: str) -> str:
+    """Service/domain label for an endpoint path, e.g. /api/users/1 -> Users"""
+    if path.startswith('/api/'):
+        parts = path.split('/')
+        if len(parts) > 2:
+            return parts[2].capitalize()
+    return 'General'
+
+def _extract_worker_count() -> int:
+    """PDF_EXTRACT_WORKERS if it is a positive integer, otherwise one less than the CPU count"""
+    default = max((os.cpu_count() or 2) - 1, 1)
+    raw = os.getenv('PDF_EXTRACT_WORKERS', '').strip()
+    if not raw:
+        return default
+    try:
+        workers = int(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid PDF_EXTRACT_WORKERS=%r", raw)
+        return default
+    return workers if workers > 0 else default
+
+def _strip_between(text: str, start: str, end: str) -> str:
+    """Remove every start...end span (shortest match, non-overlapping) using str.find"""
+    parts = []
+    pos = 0
+    while True:
+        open_at = text.find(start, pos)
+        if open_at < 0:
+            break
+        close_at = text.find(end, open_at + len(start))
+        if close_at < 0:
+            # An unterminated span is left in place
+            break
+        parts.append(text[pos:open_at])
+        pos = close_at + len(end)
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+_COLORS = {
+    'primary': HexColor('#2E86AB'),
+    'secondary': HexColor('#A23B72'),
+    'text': HexColor('#2D3748'),
+    'light_gray': HexColor('#F7FAFC'),
+    'medium_gray': HexColor('#E2E8F0'),
+}
+
+# Custom paragraph styles are built once at import and registered on each report's stylesheet
+_BASE_STYLES = getSampleStyleSheet()
+_CUSTOM_STYLE_SPECS = (
+    ('CustomTitle', 'Title', dict(fontSize=24, spaceAfter=30, textColor=_COLORS['primary'], alignment=TA_CENTER, fontName='Helvetica-Bold')),
+    ('CustomHeading1', 'Heading1', dict(fontSize=18, spaceAfter=12, spaceBefore=20, textColor=_COLORS['primary'], fontName='Helvetica-Bold')),
+    ('CustomHeading2', 'Heading2', dict(fontSize=14, spaceAfter=10, spaceBefore=15, textColor=_COLORS['secondary'], fontName='Helvetica-Bold')),
+    ('CustomBody', 'Normal', dict(fontSize=10, spaceAfter=6, textColor=_COLORS['text'], alignment=TA_JUSTIFY)),
+    ('CustomBullet', 'Normal', dict(fontSize=10, spaceAfter=4, leftIndent=20, textColor=_COLORS['text'])),
+    ('GitHubCode', 'Normal', dict(fontSize=9, fontName='Courier', textColor=_COLORS['text'], backColor=_COLORS['light_gray'], leftIndent=10, rightIndent=10, spaceAfter=6)),
+    ('PlainASCII', 'Normal', dict(fontSize=9, fontName='Courier-Bold', textColor=black, leftIndent=0, rightIndent=0, spaceAfter=2, spaceBefore=0, alignment=TA_LEFT)),
+)
+_CUSTOM_STYLES = {
+    name: ParagraphStyle(name=name, parent=_BASE_STYLES[parent], **style_kwargs)
+    for name, parent, style_kwargs in _CUSTOM_STYLE_SPECS
+}
+
+# Table styles and column widths are fixed, so each is built once and shared by every table that uses it
+_KEY_VALUE_COL_WIDTHS = (2*inch, 4*inch)
+_COVER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), _COLORS['light_gray']),
+    ('TEXTCOLOR', (0, 0), (-1, -1), _COLORS['text']),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, _COLORS['medium_gray']),
+])
+_STATS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), _COLORS['primary']),
+    ('TEXTCOLOR', (0, 0), (0, -1), white),
+    ('TEXTCOLOR', (1, 0), (1, -1), _COLORS['text']),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, _COLORS['medium_gray']),
+])
+_REQUEST_FIELDS_COL_WIDTHS = (1.2*inch, 0.8*inch, 0.7*inch, 2.8*inch)
+_REQUEST_FIELDS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COLORS['light_gray']),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _COLORS['text']),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, _COLORS['medium_gray']),
+])
+_RESPONSE_FIELDS_COL_WIDTHS = (1.5*inch, 1*inch, 3*inch)
+_RESPONSE_FIELDS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COLORS['medium_gray']),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _COLORS['text']),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, _COLORS['medium_gray']),
+])
+
+# Text-based system diagram; it only depends on the leading tech names and endpoint count
+_BACKEND_DIAGRAM_TEMPLATE = """
+┌─────────────────┐    ┌─────────────────┐    ┌─────────────────┐
+│    Frontend     │    │     Backend     │    │    Database     │
+│  {frontend:<13} │◄──►│  {backend:<13} │◄──►│  {database:<13} │
+│                 │    │                 │    │                 │
+│ • UI Components │    │ • API Endpoints │    │ • Data Storage  │
+│ • State Mgmt    │    │ • Business Logic│    │ • Transactions  │
+│ • Routing       │    │ • Authentication│    │ • Indexing      │
+└─────────────────┘    └─────────────────┘    └─────────────────┘
+                              │
+                              ▼
+                    {endpoint_count} API Endpoints
+                    ┌─────────────────┐
+                    │ RESTful Services│
+                    │ • CRUD Ops      │
+                    │ • Data Validation│
+                    │ • Error Handling│
+                    └─────────────────┘"""
+
+@lru_cache(maxsize=64)
+def _render_backend_diagram(frontend: str, backend: str, database: str, endpoint_count: int) -> str:
+    """Fill _BACKEND_DIAGRAM_TEMPLATE, memoised per (frontend, backend, database, count)"""
+    return _BACKEND_DIAGRAM_TEMPLATE.format(
+        frontend=frontend, backend=backend, database=database, endpoint_count=endpoint_count
+    )
+
+# Sequence diagram drawn by _generate_dynamic_sequence_diagram_lines, filled one line at a time
+_SEQUENCE_DIAGRAM_LINES = (
+    '{product_name} - {entity_title} Management Sequence Diagram (List + Create {entity_title})',
+    '',
+    '+-----------+     +-------------------+     +-------------------+     +-------------+',
+    '|   User    |     |    Frontend       |     |     Backend       |     |  Database   |',
+    '| (Browser) |     | ({frontend_tech:<15}) |     | ({backend_tech:<15}) |     | ({database_tech:<9})|',
+    '+-----------+     +-------------------+     +-------------------+     +-------------+',
+    '    |                   |                         |                         |',
+    '    | 1. Navigate to      |                         |                         |',
+    '    |    {main_entity} page        |                         |                         |',
+    '    |-------------------->|                         |                         |',
+    '    |                   |                         |                         |',
+    '    |                   | 2. GET /api/{main_entity}    |                         |',
+    '    |                   |------------------------>|                         |',
+    '    |                   |                         | 3. SELECT * FROM {main_entity}',
+    '    |                   |                         |------------------------>|',
+    '    |                   |                         |<------------------------|',
+    '    |                   |                         | 4. Return records       |',
+    '    |                   |<------------------------|                         |',
+    '    |                   | 5. 200 OK + JSON        |                         |',
+    '    |<--------------------|                         |                         |',
+    '    | 6. Display {main_entity} list |                         |                         |',
+    '    |                   |                         |                         |',
+    '    | 7. Click "Create"   |                         |                         |',
+    '    |-------------------->|                         |                         |',
+    '    |                   |                         |                         |',
+    '    |                   | 8. POST /api/{main_entity}   |                         |',
+    '    |                   | {{name, desc...}}        |                         |',
+    '    |                   |------------------------>|                         |',
+    '    |                   |                         | 9. INSERT INTO {main_entity}',
+    '    |                   |                         |------------------------>|',
+    '    |                   |                         |<------------------------|',
+    '    |                   |                         | 10. Return new ID       |',
+    '    |                   |<------------------------|                         |',
+    '    |                   | 11. 201 Created + JSON  |                         |',
+    '    |<--------------------|                         |                         |',
+    '    | 12. Success message |                         |                         |',
+    '    |    & update UI      |                         |                         |',
+)
+
+# Goal, feature and API bullets repeat across reports, so their XML escapes are memoised
+_escape_bullet = lru_cache(maxsize=2048)(escape)
+
+# Architecture goals used when the PRD states none; plain literals that need no XML escaping
+_FRONTEND_GOAL = "Deliver responsive and intuitive user interface"
+_BACKEND_GOAL = "Implement scalable backend services"
+_DEFAULT_GOALS = (
+    "Ensure secure and maintainable code architecture",
+    "Support efficient development and deployment workflows",
+    "Enable cross-platform compatibility and performance",
+)
+
+# Executive summary wording, indexed by whether any backend was detected
+_SUMMARY_BACKEND_NOTES = (
+    "No backend code detected – recommendations based on PRD requirements.",
+    "Backend components detected and analyzed.",
+)
+# Key findings, filled with (API, frontend, backend, language, recommendation) counts
+_EXECUTIVE_FINDING_TEMPLATES = (
+    "• {} API endpoints (repo + PRD) identified and documented",
+    "• {} frontend components analyzed",
+    "• {} backend technologies detected",
+    "• {} programming languages in use",
+    "• {} architectural recommendations provided",
+)
+
+@dataclass(slots=True)
+class _FolderIndex:
+    """Folder-name and entry-file indicator flags, derived once per report"""
+    has_frontend_folder: bool
+    has_backend_folder: bool
+    has_api_folder: bool
+    has_frontend_file: bool
+
+def _per_report(method):
+    """Memoise a zero-argument GitHubPDFService method for the report being generated"""
+    name = method.__name__
+    
+    @wraps(method)
+    def wrapper(self):
+        cache = self._report_cache
+        if name not in cache:
+            cache[name] = method(self)
+        return cache[name]
+    
+    return wrapper
 
 class GitHubPDFService:
     def __init__(self, output_dir: str = "generated_pdfs"):
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        self._prepared_output_dir = output_dir
 
         
-        self.colors = {
-            'primary': HexColor('#2E86AB'),
-            'secondary': HexColor('#A23B72'),
-            'text': HexColor('#2D3748'),
-            'light_gray': HexColor('#F7FAFC'),
-            'medium_gray': HexColor('#E2E8F0'),
-        }
+        self.colors = _COLORS
         
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
-    
-    def _sanitize_text(self, text: Any) -> str:
-        return "" if not text else escape(str(text))
+        
+        # Parsed PRDs keyed by content digest, so the (possibly multi-MB) text is never held as a key
+        self._prd_cache: Dict[bytes, Dict[str, Any]] = {}
+        # Endpoint inventories keyed by _endpoint_inputs_digest, reused when a report is regenerated
+        self._endpoint_cache: Dict[bytes, List[Dict]] = {}
+        # Values derived from the current report's analyses; see _per_report
+        self._report_cache: Dict[str, Any] = {}
+        # One diagram generator shared by all sections, and the content-addressed diagrams this process rendered
+        self._diagram_generator: Optional['ArchitectureDiagramGenerator'] = None
+        self._rendered_diagrams: Dict[str, None] = {}
+    
+    def _get_diagram_generator(self) -> 'ArchitectureDiagramGenerator':
+        """Shared diagram generator, created on first use and recreated only when output_dir has been repointed"""
+        generator = self._diagram_generator
+        if generator is None or generator.output_dir != self.output_dir:
+            from app.agents.architecture.services.diagram_generator import ArchitectureDiagramGenerator
+            generator = self._diagram_generator = ArchitectureDiagramGenerator(self.output_dir)
+        return generator
+    
+    def _render_diagram(self, kind: str, **params) -> str:
+        """Render a generate_<kind>_diagram PNG under a name derived from its inputs, reusing it within this process"""
+        inputs = (kind, *sorted(
+            (name, tuple(value) if isinstance(value, list) else value) for name, value in params.items()
+        ))
+        digest = hashlib.blake2b(repr(inputs).encode('utf-8'), digest_size=16).hexdigest()
+        path = os.path.join(self.output_dir, f'{kind}_diagram_{digest}.png')
+        # Files left by another process (or an older generator) are re-rendered, never trusted
+        if path not in self._rendered_diagrams or not os.path.exists(path):
+            from app.agents.architecture.services.diagram_generator import ArchitectureDiagramGenerator
+            # The generator names files by the second, so each render gets a private directory before the move
+            with tempfile.TemporaryDirectory(dir=self.output_dir) as render_dir:
+                generate = getattr(ArchitectureDiagramGenerator(render_dir), f'generate_{kind}_diagram')
+                os.replace(generate(**params), path)
+            if path not in self._rendered_diagrams and len(self._rendered_diagrams) >= _DIAGRAM_CACHE_SIZE:
+                del self._rendered_diagrams[next(iter(self._rendered_diagrams))]
+            self._rendered_diagrams[path] = None
+        return path
+    
+    @staticmethod
+    def _get_embeddable_diagram(diagram_path: str, width: float, height: float) -> str:
+        """Downscaled JPEG copy of a rendered diagram, which ReportLab embeds without decoding"""
+        if PILImage is None:
+            return diagram_path
+        jpeg_path = os.path.splitext(diagram_path)[0] + '.jpg'
+        try:
+            if not os.path.exists(jpeg_path) or os.path.getmtime(jpeg_path) < os.path.getmtime(diagram_path):
+                with PILImage.open(diagram_path) as img:
+                    img = img.convert('RGB')
+                    img.thumbnail((int(width / inch * _DIAGRAM_EMBED_DPI), int(height / inch * _DIAGRAM_EMBED_DPI)))
+                # Written beside the target and moved into place, so a concurrent report never embeds a partial file
+                fd, tmp_path = tempfile.mkstemp(suffix='.jpg', dir=os.path.dirname(jpeg_path))
+                try:
+                    with os.fdopen(fd, 'wb') as tmp_file:
+                        img.save(tmp_file, 'JPEG', quality=_DIAGRAM_JPEG_QUALITY, optimize=True)
+                    os.replace(tmp_path, jpeg_path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+        except (OSError, ValueError) as e:
+            logger.warning("Embedding full-size diagram %s: %s", diagram_path, e)
+            return diagram_path
+        return jpeg_path
+    
+    @staticmethod
+    def _sanitize_text(text: Any) -> str:
+        return "" if not text else _escape_bullet(str(text))
 
-    def _setup_custom_styles(self):
-        self.styles.add(ParagraphStyle(name='CustomTitle', parent=self.styles['Title'], fontSize=24, spaceAfter=30, textColor=self.colors['primary'], alignment=TA_CENTER, fontName='Helvetica-Bold'))
-        self.styles.add(ParagraphStyle(name='CustomHeading1', parent=self.styles['Heading1'], fontSize=18, spaceAfter=12, spaceBefore=20, textColor=self.colors['primary'], fontName='Helvetica-Bold'))
-        self.styles.add(ParagraphStyle(name='CustomHeading2', parent=self.styles['Heading2'], fontSize=14, spaceAfter=10, spaceBefore=15, textColor=self.colors['secondary'], fontName='Helvetica-Bold'))
-        self.styles.add(ParagraphStyle(name='CustomBody', parent=self.styles['Normal'], fontSize=10, spaceAfter=6, textColor=self.colors['text'], alignment=TA_JUSTIFY))
-        self.styles.add(ParagraphStyle(name='CustomBullet', parent=self.styles['Normal'], fontSize=10, spaceAfter=4, leftIndent=20, textColor=self.colors['text']))
-        self.styles.add(ParagraphStyle(name='GitHubCode', parent=self.styles['Normal'], fontSize=9, fontName='Courier', textColor=self.colors['text'], backColor=self.colors['light_gray'], leftIndent=10, rightIndent=10, spaceAfter=6))
-    
-    def extract_text_from_file(self, file_path: str) -> str:
+    @classmethod
+    def extract_text_from_file(cls, file_path: str) -> str:
         """Universal document reader - supports PDF, DOCX, PPTX, XLSX, TXT, and more"""
         if not os.path.exists(file_path):
             raise ValueError(f"File not found: {file_path}")
@@ -102,38 +680,83 @@ class GitHubPDFService:
         
         try:
             if ext == '.pdf':
-                text = self._extract_pdf_text(file_path)
+                text = cls._extract_pdf_text(file_path)
             elif ext in ['.docx', '.doc']:
-                text = self._extract_word_text(file_path)
+                text = cls._extract_word_text(file_path)
             elif ext in ['.pptx', '.ppt']:
-                text = self._extract_powerpoint_text(file_path)
+                text = cls._extract_powerpoint_text(file_path)
             elif ext in ['.xlsx', '.xls']:
-                text = self._extract_excel_text(file_path)
+                text = cls._extract_excel_text(file_path)
             elif ext in ['.txt', '.md', '.rtf']:
-                text = self._extract_plain_text(file_path)
+                text = cls._extract_plain_text(file_path)
             else:
                 # Try as plain text fallback
-                text = self._extract_plain_text(file_path)
+                text = cls._extract_plain_text(file_path)
             
             # Universal text cleaning
-            return self._clean_extracted_text(text)
+            return cls._clean_extracted_text(text) if text else ""
             
         except Exception as e:
             logger.error(f"Document extraction failed for {file_path}: {str(e)}")
             raise ValueError(f"Failed to read {ext} file: {str(e)}. Ensure required libraries are installed.")
     
-    def _extract_pdf_text(self, file_path: str) -> str:
+    def batch_extract(self, file_paths: List[str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Extract text from several documents in parallel worker processes.
+        
+        Returns (texts, errors): extracted text per readable path and the failure message per unreadable one.
+        """
+        texts: Dict[str, str] = {}
+        errors: Dict[str, str] = {}
+        if len(file_paths) <= 1:
+            for path in file_paths:
+                try:
+                    texts[path] = self.extract_text_from_file(path)
+                except Exception as e:
+                    errors[path] = str(e)
+            return texts, errors
+        
+        unique_paths = list(dict.fromkeys(file_paths))
+        workers = min(_extract_worker_count(), len(unique_paths))
+        
+        # Spawned rather than forked from the (threaded) server process, and shut down when the batch is done
+        # extract_text_from_file is a classmethod, so workers only unpickle the class
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            futures = {path: pool.submit(self.extract_text_from_file, path) for path in unique_paths}
+            for path, future in futures.items():
+                try:
+                    texts[path] = future.result()
+                except Exception as e:
+                    errors[path] = str(e)
+        return texts, errors
+    
+    @classmethod
+    def _extract_pdf_text(cls, file_path: str, max_pages: Optional[int] = None, max_chars: Optional[int] = None) -> str:
         """Extract text from PDF files with multiple fallback methods"""
-        text = ""
+        # Try PyMuPDF first when installed (optional: AGPL-licensed, so not in requirements.txt)
+        if fitz:
+            try:
+                with fitz.open(file_path) as doc:
+                    fitz_text = "\n".join(cls._take_pages((page.get_text("text") for page in doc), max_pages, max_chars))
+                if fitz_text.strip():
+                    return fitz_text
+            except Exception as e:
+                logger.warning(f"PyMuPDF failed: {e}")
         
-        # Try pdfplumber first (better text extraction)
+        # Fallback to pypdfium2 (permissively licensed, near PyMuPDF speed)
+        if pdfium:
+            try:
+                pdfium_text = cls._extract_pdfium_text(file_path, max_pages, max_chars)
+                if pdfium_text.strip():
+                    return pdfium_text
+            except Exception as e:
+                logger.warning(f"pypdfium2 failed: {e}")
+        
+        # Fallback to pdfplumber (layout-aware text extraction)
         if pdfplumber:
             try:
                 with pdfplumber.open(file_path) as pdf:
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
+                    pages = cls._take_pages((page.extract_text() or '' for page in pdf.pages), max_pages, max_chars)
+                text = "\n".join(filter(None, pages))
                 if text.strip():
                     return text
             except Exception as e:
@@ -144,67 +767,165 @@ class GitHubPDFService:
             try:
                 with open(file_path, 'rb') as f:
                     reader = PyPDF2.PdfReader(f)
-                    for page in reader.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
+                    pages = cls._take_pages((page.extract_text() or '' for page in reader.pages), max_pages, max_chars)
+                text = "\n".join(filter(None, pages))
                 if text.strip():
                     return text
             except Exception as e:
                 logger.warning(f"PyPDF2 failed: {e}")
         
-        raise ImportError("No PDF libraries available. Install: pip install pdfplumber PyPDF2")
+        raise ImportError("No PDF libraries available. Install: pip install pypdfium2 pdfplumber PyPDF2")
+    
+    @staticmethod
+    def _take_pages(page_texts: Iterable[str], max_pages: Optional[int] = None, max_chars: Optional[int] = None) -> List[str]:
+        """Collect page texts lazily until the page or character budget is reached"""
+        pages = []
+        total_chars = 0
+        for page_text in islice(page_texts, max_pages):
+            pages.append(page_text)
+            total_chars += len(page_text)
+            if max_chars and total_chars >= max_chars:
+                break
+        return pages
+    
+    @classmethod
+    def _extract_pdfium_text(cls, file_path: str, max_pages: Optional[int] = None, max_chars: Optional[int] = None) -> str:
+        """Extract whole-page text with pypdfium2, releasing each page as it goes"""
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            # Close the page generator before the document so a partially read page is released first
+            with closing(cls._iter_pdfium_pages(pdf)) as page_texts:
+                return "\n".join(cls._take_pages(page_texts, max_pages, max_chars))
+        finally:
+            pdf.close()
+    
+    @staticmethod
+    def _iter_pdfium_pages(pdf) -> Iterator[str]:
+        """Yield the text of each pypdfium2 page, closing the page handles after use"""
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                yield textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
     
-    def _extract_word_text(self, file_path: str) -> str:
+    @staticmethod
+    def _extract_word_text(file_path: str) -> str:
         """Extract text from Word documents with enhanced cleaning"""
+        # Read document.xml directly with lxml instead of building the python-docx object model
+        if etree is not None:
+            with zipfile.ZipFile(file_path) as archive:
+                body = etree.fromstring(archive.read('word/document.xml')).find(_W_BODY)
+            
+            paragraphs = []
+            table_rows = []
+            for element in body if body is not None else ():
+                if element.tag == _W_P:
+                    text = GitHubPDFService._docx_paragraph_text(element)
+                    if text.strip():
+                        paragraphs.append(text)
+                elif element.tag == _W_TBL:
+                    for row in element.iterfind(_W_TR):
+                        cells = ('\n'.join(map(GitHubPDFService._docx_paragraph_text, cell.iterfind(_W_P))).strip()
+                                 for cell in row.iterfind(_W_TC))
+                        row_text = ' | '.join(cell for cell in cells if cell)
+                        if row_text.strip():
+                            table_rows.append(row_text)
+            
+            return "\n".join(paragraphs + table_rows)
+        
         if not Document:
             raise ImportError("python-docx not available. Install: pip install python-docx")
         
-        text = ""
         doc = Document(file_path)
         
         # Extract paragraphs
-        for para in doc.paragraphs:
-            if para.text.strip():
-                text += para.text + "\n"
+        paragraphs = [para.text for para in doc.paragraphs if para.text.strip()]
         
         # Extract tables
+        table_rows = []
         for table in doc.tables:
             for row in table.rows:
                 row_text = ' | '.join([cell.text.strip() for cell in row.cells if cell.text.strip()])
                 if row_text.strip():
-                    text += row_text + "\n"
-        
-        return text
+                    table_rows.append(row_text)
+        
+        return "\n".join(paragraphs + table_rows)
+    
+    @staticmethod
+    def _docx_paragraph_text(paragraph) -> str:
+        """Concatenate run text of a w:p element the way python-docx renders it"""
+        parts = []
+        for run in paragraph.xpath(_W_RUNS_XPATH, namespaces=_W_NSMAP):
+            for node in run:
+                if node.tag == _W_T:
+                    parts.append(node.text or '')
+                elif node.tag == _W_BR:
+                    # Page and column breaks carry no text
+                    if node.get(_W_BR_TYPE, 'textWrapping') == 'textWrapping':
+                        parts.append('\n')
+                else:
+                    parts.append(_W_RUN_CHARS.get(node.tag, ''))
+        return ''.join(parts)
     
-    def _extract_powerpoint_text(self, file_path: str) -> str:
+    @staticmethod
+    def _extract_powerpoint_text(file_path: str) -> str:
         """Extract text from PowerPoint presentations"""
+        # Walk the slide XML with lxml instead of building the python-pptx shape tree
+        if etree is not None:
+            parts = []
+            with zipfile.ZipFile(file_path) as archive:
+                presentation = etree.fromstring(archive.read('ppt/presentation.xml'))
+                targets = {rel.get('Id'): rel.get('Target')
+                           for rel in etree.fromstring(archive.read('ppt/_rels/presentation.xml.rels'))}
+                
+                # Slides follow the presentation's slide list, not part-name order
+                for slide_num, slide_id in enumerate(presentation.iterfind(_P_SLIDE_IDS), 1):
+                    parts.append(f"--- Slide {slide_num} ---")
+                    part_name = posixpath.normpath(posixpath.join('ppt', targets[slide_id.get(_R_ID)])).lstrip('/')
+                    slide = etree.fromstring(archive.read(part_name))
+                    for shape in slide.iterfind(_P_SHAPES):
+                        text = "\n".join(map(GitHubPDFService._pptx_paragraph_text, shape.iterfind(_P_PARAGRAPHS)))
+                        if text.strip():
+                            parts.append(text)
+            
+            return "\n".join(parts)
+        
         if not Presentation:
             raise ImportError("python-pptx not available. Install: pip install python-pptx")
         
-        text = ""
+        parts = []
         prs = Presentation(file_path)
         
         for slide_num, slide in enumerate(prs.slides, 1):
-            text += f"\n--- Slide {slide_num} ---\n"
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    text += shape.text + "\n"
+            parts.append(f"--- Slide {slide_num} ---")
+            parts.extend(shape.text for shape in slide.shapes if hasattr(shape, "text") and shape.text.strip())
         
-        return text
+        return "\n".join(parts)
     
-    def _extract_excel_text(self, file_path: str) -> str:
+    @staticmethod
+    def _pptx_paragraph_text(paragraph) -> str:
+        """Concatenate run and field text of an a:p element the way python-pptx renders it"""
+        return ''.join(
+            '\v' if node.tag == _A_BR else (node.findtext(_A_T) or '')
+            for node in paragraph if node.tag in _A_TEXT_NODES
+        )
+    
+    @staticmethod
+    def _extract_excel_text(file_path: str) -> str:
         """Extract text from Excel files"""
-        text = ""
-        
         # Try pandas first
         if pd:
             try:
-                df = pd.read_excel(file_path, sheet_name=None)  # Read all sheets
-                for sheet_name, sheet_df in df.items():
-                    text += f"\n--- Sheet: {sheet_name} ---\n"
-                    text += sheet_df.to_string(index=False) + "\n"
-                return text
+                # Open the workbook once and parse sheets one at a time
+                with pd.ExcelFile(file_path) as xl:
+                    parts = []
+                    for sheet_name in xl.sheet_names:
+                        parts.append(f"--- Sheet: {sheet_name} ---")
+                        # Tab-separated values are enough for text analysis and skip column alignment
+                        parts.append(xl.parse(sheet_name).to_csv(sep="\t", index=False))
+                return "\n".join(parts)
             except Exception as e:
                 logger.warning(f"pandas Excel read failed: {e}")
         
@@ -212,101 +933,85 @@ class GitHubPDFService:
         if openpyxl:
             try:
                 from openpyxl import load_workbook
-                wb = load_workbook(file_path, data_only=True)
-                for sheet_name in wb.sheetnames:
-                    text += f"\n--- Sheet: {sheet_name} ---\n"
-                    ws = wb[sheet_name]
-                    for row in ws.iter_rows(values_only=True):
-                        row_text = ' | '.join([str(cell) for cell in row if cell is not None])
-                        if row_text.strip():
-                            text += row_text + "\n"
-                return text
+                # Read-only mode streams rows from the XML instead of loading the whole grid
+                wb = load_workbook(file_path, data_only=True, read_only=True)
+                try:
+                    parts = []
+                    for sheet_name in wb.sheetnames:
+                        parts.append(f"--- Sheet: {sheet_name} ---")
+                        ws = wb[sheet_name]
+                        for row in ws.iter_rows(values_only=True):
+                            row_text = ' | '.join([str(cell) for cell in row if cell is not None])
+                            if row_text.strip():
+                                parts.append(row_text)
+                    return "\n".join(parts)
+                finally:
+                    # Read-only workbooks keep the zip archive open until closed
+                    wb.close()
             except Exception as e:
                 logger.warning(f"openpyxl failed: {e}")
         
         raise ImportError("No Excel libraries available. Install: pip install pandas openpyxl")
     
-    def _extract_plain_text(self, file_path: str) -> str:
+    @staticmethod
+    def _extract_plain_text(file_path: str) -> str:
         """Extract text from plain text files with encoding detection"""
-        encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252', 'ascii']
+        # Read once; every decoding attempt below works on the same buffer
+        with open(file_path, 'rb') as f:
+            data = f.read()
         
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    return f.read()
-            except (UnicodeDecodeError, UnicodeError):
-                continue
+        # Fast path: most uploads are UTF-8; control bytes are stripped before paying for decoding
+        try:
+            return data.translate(None, _CTRL_BYTES).decode('utf-8')
+        except UnicodeDecodeError:
+            pass
         
-        # Last resort: read as binary and decode with errors='ignore'
-        with open(file_path, 'rb') as f:
-            return f.read().decode('utf-8', errors='ignore')
+        # Detect the encoding once instead of trial-decoding the whole file per candidate
+        if detect_charset:
+            best = detect_charset(data).best()
+            if best is not None:
+                return str(best)
+        
+        # Last resort: decode with errors='ignore'
+        return data.decode('utf-8', errors='ignore')
     
-    def _clean_extracted_text(self, text: str) -> str:
+    @staticmethod
+    def _clean_extracted_text(text: str) -> str:
         """Universal text cleaning to prevent PDF generation errors"""
-        if not text:
+        # Scanned PDFs without a text layer often yield only whitespace
+        if not text or text.isspace():
             return ""
         
         # Remove PDF artifacts
         if text.startswith('%PDF'):
-            text = re.sub(r'%PDF-.*?(\n\n|\n[A-Z])', '', text, flags=re.DOTALL)
-        
-        # Remove binary/control characters that cause paraparser errors
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]', '', text)
-        
-        # Replace problematic Unicode and special characters
-        replacements = {
-            '\u2018': "'",  # Left single quote
-            '\u2019': "'",  # Right single quote
-            '\u201c': '"',  # Left double quote
-            '\u201d': '"',  # Right double quote
-            '\u2013': '-',  # En dash
-            '\u2014': '--', # Em dash
-            '\u2026': '...', # Ellipsis
-            '\u00a0': ' ',  # Non-breaking space
-            '&quot;': '"',  # HTML encoded quote
-            '&amp;': '&',   # HTML encoded ampersand
-            '&lt;': '<',    # HTML encoded less than
-            '&gt;': '>',    # HTML encoded greater than
-            '&nbsp;': ' ',  # HTML non-breaking space
-            '\u00b0': ' degrees',  # Degree symbol
-            '\u2022': '•',  # Bullet point
-            '\u00ae': '(R)', # Registered trademark
-            '\u00a9': '(C)', # Copyright
-            '\u2122': '(TM)', # Trademark
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        
-        # Remove HTML tags that might cause issues
-        text = re.sub(r'<[^>]+>', '', text)
+            text = _RE_PDF_HDR.sub('', text)
         
-        # Clean up whitespace and line breaks
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        clean_text = '\n'.join(lines)
-        
-        # Remove any remaining non-ASCII characters that could cause issues
-        clean_text = re.sub(r'[^\x20-\x7E\n\r\t•]', ' ', clean_text)
+        # Drop control characters and replace problematic Unicode in one pass
+        if text.isascii():
+            # Nothing to replace; dropping control bytes needs no per-character table lookups
+            text = text.encode('ascii').translate(None, _CTRL_BYTES).decode('ascii')
+        else:
+            text = text.translate(_UNICODE_REPLACEMENTS)
+        if '&' in text:
+            text = _RE_HTML_ENTITY.sub(lambda match: _HTML_ENTITIES[match.group()], text)
         
-        # Clean up multiple spaces
-        clean_text = re.sub(r'\s+', ' ', clean_text)
-        clean_text = re.sub(r'\n\s*\n', '\n', clean_text)
+        # Remove HTML tags, then replace non-ASCII characters and collapse whitespace in one pass
+        if '<' in text:
+            text = _RE_HTML_TAG.sub('', text)
+        text = _RE_GAP.sub(' ', text)
         
-        return clean_text.strip()
+        return text.strip()
 
     def _setup_custom_styles(self):
-        self.styles.add(ParagraphStyle(name='CustomTitle', parent=self.styles['Title'], fontSize=24, spaceAfter=30, textColor=self.colors['primary'], alignment=TA_CENTER, fontName='Helvetica-Bold'))
-        self.styles.add(ParagraphStyle(name='CustomHeading1', parent=self.styles['Heading1'], fontSize=18, spaceAfter=12, spaceBefore=20, textColor=self.colors['primary'], fontName='Helvetica-Bold'))
-        self.styles.add(ParagraphStyle(name='CustomHeading2', parent=self.styles['Heading2'], fontSize=14, spaceAfter=10, spaceBefore=15, textColor=self.colors['secondary'], fontName='Helvetica-Bold'))
-        self.styles.add(ParagraphStyle(name='CustomBody', parent=self.styles['Normal'], fontSize=10, spaceAfter=6, textColor=self.colors['text'], alignment=TA_JUSTIFY))
-        self.styles.add(ParagraphStyle(name='CustomBullet', parent=self.styles['Normal'], fontSize=10, spaceAfter=4, leftIndent=20, textColor=self.colors['text']))
-        self.styles.add(ParagraphStyle(name='GitHubCode', parent=self.styles['Normal'], fontSize=9, fontName='Courier', textColor=self.colors['text'], backColor=self.colors['light_gray'], leftIndent=10, rightIndent=10, spaceAfter=6))
-        self.styles.add(ParagraphStyle(name='PlainASCII', parent=self.styles['Normal'], fontSize=9, fontName='Courier-Bold', textColor=black, leftIndent=0, rightIndent=0, spaceAfter=2, spaceBefore=0, alignment=TA_LEFT))
+        # Skip styles already registered so a shared stylesheet never raises on re-registration
+        for name, style in _CUSTOM_STYLES.items():
+            if name not in self.styles:
+                self.styles.add(style)
 
     def analyze_repo_from_object(self, repo_analysis) -> Dict:
         """Convert repo_analysis object to expected format with real data extraction"""
         try:
-            logger.info(f"🔍 Analyzing RepositoryAnalysis object: {type(repo_analysis)}")
+            logger.debug("🔍 Analyzing RepositoryAnalysis object: %s", type(repo_analysis))
             
             # Extract data from RepositoryAnalysis dataclass
             tech_stack = getattr(repo_analysis, 'tech_stack', {})
@@ -332,8 +1037,8 @@ class GitHubPDFService:
             # Get build tools
             build_tools = getattr(repo_analysis, 'build_tools', [])
             
-            logger.info(f"📊 Extracted data - Files: {actual_file_count}, Components: {actual_components}, APIs: {len(api_endpoints)}")
-            logger.info(f"📊 Tech stack - Languages: {languages}, Frontend: {frontend_tech}, Backend: {backend_tech}")
+            logger.info("📊 Extracted data - Files: %s, Components: %s, APIs: %d", actual_file_count, actual_components, len(api_endpoints))
+            logger.debug("📊 Tech stack - Languages: %s, Frontend: %s, Backend: %s", languages, frontend_tech, backend_tech)
             
             # Convert languages list to dict format expected by PDF service
             languages_dict = {}
@@ -374,7 +1079,8 @@ class GitHubPDFService:
                 'folder_structure': folder_structure
             }
             
-            logger.info(f"🎯 Final repo analysis result: file_count={result['file_count']}, languages={len(result['languages'])}, components={result['components_total']}, apis={len(result['api_endpoints'])}")
+            logger.info("🎯 Final repo analysis result: file_count=%s, languages=%d, components=%s, apis=%d",
+                        result['file_count'], len(result['languages']), result['components_total'], len(result['api_endpoints']))
             return result
         except Exception as e:
             logger.error(f"❌ Error analyzing repo object: {str(e)}")
@@ -383,6 +1089,27 @@ class GitHubPDFService:
                 logger.error(f"📋 Repo analysis attributes: {list(repo_analysis.__dict__.keys())}")
             return self._get_default_analysis()
     
+    @staticmethod
+    def _build_file_index(folder_structure: Dict) -> List[Tuple[str, str, str]]:
+        """Flatten folder structure into (folder, filename, extension) tuples"""
+        return [
+            (folder, file, os.path.splitext(file)[1])
+            for folder, info in folder_structure.items()
+            if isinstance(info, dict)
+            for file in info.get('files', ())
+        ]
+    
+    @staticmethod
+    def _build_folder_index(folder_structure: Dict, file_names: set) -> _FolderIndex:
+        """Lower folder names once and resolve the folder/file indicators the _has_*_indicators checks read"""
+        folders_lower = tuple(folder.lower() for folder in folder_structure)
+        return _FolderIndex(
+            has_frontend_folder=any(map(_FRONTEND_FOLDER_RE.search, folders_lower)),
+            has_backend_folder=any(map(_BACKEND_FOLDER_RE.search, folders_lower)),
+            has_api_folder=any(map(_API_FOLDER_RE.search, folders_lower)),
+            has_frontend_file=not _FRONTEND_ENTRY_FILES.isdisjoint(file_names),
+        )
+    
     def _extract_entities_from_prd(self, prd_content: str) -> List[str]:
         """Extract database entities from PRD schema section"""
         if not prd_content:
@@ -391,27 +1118,14 @@ class GitHubPDFService:
         entities = set()
         
         # Extract from database schema table definitions
-        schema_patterns = [
-            r'(?:Table|Entity)\s+([A-Za-z]+)\s+(?:Fields|Columns)',
-            r'([A-Za-z]+)\s+(?:table|entity)\s*:?\s*(?:Fields|Columns)',
-            r'\b([A-Z][a-z]+)\s+(?:user_id|hotel_id|room_id|booking_id)',  # Table with ID fields
-        ]
-        
-        for pattern in schema_patterns:
-            matches = re.findall(pattern, prd_content, re.IGNORECASE)
-            entities.update([m.lower() for m in matches])
+        for pattern in _ENTITY_SCHEMA_PATTERNS:
+            entities.update(match.group(1).lower() for match in pattern.finditer(prd_content))
         
         # Extract from explicit API endpoints
-        api_patterns = [
-            r'/(?:api/)?([a-zA-Z]+)(?:/|\s|$)',  # /api/users, /hotels
-            r'/auth/([a-zA-Z]+)',  # /auth/register, /auth/login
-        ]
-        
-        for pattern in api_patterns:
-            matches = re.findall(pattern, prd_content)
-            for match in matches:
-                if match.lower() not in ['api', 'auth', 'register', 'login']:
-                    entities.add(match.lower())
+        api_entities = set()
+        for pattern in _ENTITY_API_PATTERNS:
+            api_entities.update(match.group(1).lower() for match in pattern.finditer(prd_content))
+        entities.update(api_entities - _ENTITY_API_STOPWORDS)
         
         # Clean and validate entities
         valid_entities = []
@@ -421,6 +1135,16 @@ class GitHubPDFService:
         
         return valid_entities[:6]
     
+    @_per_report
+    def _get_prd_content_lower(self) -> str:
+        """Lowercased PRD text, shared by the keyword checks instead of re-lowering it in each one"""
+        return self._prd_analysis.get('content', '').lower()
+    
+    @_per_report
+    def _get_prd_entities(self) -> List[str]:
+        """Entities of the current PRD, scanned once per report"""
+        return self._extract_entities_from_prd(self._prd_analysis.get('content', ''))
+    
     def _infer_backend_technologies(self) -> List[str]:
         """Dynamically infer backend technologies based on repository analysis"""
         backend_tech = []
@@ -462,16 +1186,10 @@ class GitHubPDFService:
             languages.append('Python')
         
         # Check folder structure for file extensions
-        folder_structure = self._repo_analysis.get('folder_structure', {})
-        for folder, info in folder_structure.items():
-            if isinstance(info, dict) and 'files' in info:
-                for file in info['files']:
-                    if file.endswith(('.py',)) and 'Python' not in languages:
-                        languages.append('Python')
-                    elif file.endswith(('.js', '.jsx', '.ts', '.tsx')) and 'JavaScript' not in languages:
-                        languages.append('JavaScript')
-                    elif file.endswith(('.java',)) and 'Java' not in languages:
-                        languages.append('Java')
+        for _, _, ext in self._file_index:
+            language = _LANGUAGE_BY_EXT.get(ext)
+            if language and language not in languages:
+                languages.append(language)
         
         return languages or ['JavaScript']  # Default to JavaScript if nothing detected
     
@@ -517,49 +1235,33 @@ class GitHubPDFService:
     def _extract_real_component_names(self) -> List[str]:
         """Extract real component names from repository structure"""
         component_names = []
-        folder_structure = self._repo_analysis.get('folder_structure', {})
-        
-        for folder, info in folder_structure.items():
-            if isinstance(info, dict) and 'files' in info:
-                for file in info['files']:
-                    # Extract component names from React/Vue/Angular files
-                    if file.endswith(('.jsx', '.tsx', '.vue', '.component.ts')):
-                        # Remove extension and clean name
-                        name = file.replace('.jsx', '').replace('.tsx', '').replace('.vue', '').replace('.component.ts', '')
-                        if name and name not in ['index', 'App', 'main']:
-                            component_names.append(name)
-                    elif file.endswith(('.js', '.ts')) and not file.endswith(('.test.js', '.test.ts', '.spec.js', '.spec.ts')):
-                        # Check if it's likely a component file
-                        name = file.replace('.js', '').replace('.ts', '')
-                        if name and name[0].isupper() and name not in ['App', 'Index', 'Main']:
-                            component_names.append(name)
+        
+        for _, file, ext in self._file_index:
+            # Extract component names from React/Vue/Angular files
+            if ext in ('.jsx', '.tsx', '.vue') or file.endswith('.component.ts'):
+                # Remove extension and clean name
+                name = file.replace('.jsx', '').replace('.tsx', '').replace('.vue', '').replace('.component.ts', '')
+                if name and name not in ['index', 'App', 'main']:
+                    component_names.append(name)
+            elif ext in ('.js', '.ts') and not file.endswith(('.test.js', '.test.ts', '.spec.js', '.spec.ts')):
+                # Check if it's likely a component file
+                name = file.replace('.js', '').replace('.ts', '')
+                if name and name[0].isupper() and name not in ['App', 'Index', 'Main']:
+                    component_names.append(name)
         
         return list(set(component_names))[:10]  # Return unique names, limit to 10
     
     def _extract_frontend_tech_from_files(self) -> List[str]:
         """Extract frontend technologies from file extensions and package files"""
         tech = []
-        folder_structure = self._repo_analysis.get('folder_structure', {})
-        
-        has_react = False
-        has_vue = False
-        has_angular = False
-        has_typescript = False
-        
-        for folder, info in folder_structure.items():
-            if isinstance(info, dict) and 'files' in info:
-                for file in info['files']:
-                    if file.endswith(('.jsx', '.tsx')):
-                        has_react = True
-                        if file.endswith('.tsx'):
-                            has_typescript = True
-                    elif file.endswith('.vue'):
-                        has_vue = True
-                    elif file.endswith('.component.ts'):
-                        has_angular = True
-                        has_typescript = True
-                    elif file.endswith('.ts') and not file.endswith('.d.ts'):
-                        has_typescript = True
+        
+        ext_counts = self._ext_counts
+        ts_files = [file for _, file, ext in self._file_index if ext == '.ts']
+        
+        has_react = ext_counts['.jsx'] > 0 or ext_counts['.tsx'] > 0
+        has_vue = ext_counts['.vue'] > 0
+        has_angular = any(file.endswith('.component.ts') for file in ts_files)
+        has_typescript = ext_counts['.tsx'] > 0 or any(not file.endswith('.d.ts') for file in ts_files)
         
         if has_react:
             tech.append('React')
@@ -577,16 +1279,11 @@ class GitHubPDFService:
     def _analyze_frontend_structure(self) -> List[str]:
         """Analyze frontend structure and return key insights"""
         structure_insights = []
-        folder_structure = self._repo_analysis.get('folder_structure', {})
         
         # Analyze folder patterns
-        frontend_folders = []
-        for folder, info in folder_structure.items():
-            if isinstance(info, dict) and 'files' in info:
-                files = info['files']
-                js_files = [f for f in files if f.endswith(('.js', '.jsx', '.ts', '.tsx', '.vue'))]
-                if js_files:
-                    frontend_folders.append((folder, len(js_files)))
+        frontend_folders = list(Counter(
+            folder for folder, _, ext in self._file_index if ext in _FRONTEND_FILE_EXTS
+        ).items())
         
         # Sort by file count
         frontend_folders.sort(key=lambda x: x[1], reverse=True)
@@ -611,13 +1308,36 @@ class GitHubPDFService:
         
         return structure_insights
     
+    @_per_report
     def _get_comprehensive_api_endpoints(self) -> List[Dict]:
         """Get comprehensive API endpoints from repository, PRD, and frontend analysis"""
+        key = self._endpoint_inputs_digest()
+        endpoints = self._endpoint_cache.get(key)
+        if endpoints is None:
+            if len(self._endpoint_cache) >= _ENDPOINT_CACHE_SIZE:
+                del self._endpoint_cache[next(iter(self._endpoint_cache))]
+            endpoints = self._endpoint_cache[key] = self._collect_api_endpoints()
+        return endpoints
+    
+    def _endpoint_inputs_digest(self) -> bytes:
+        """Digest of everything endpoint collection reads: PRD text, repo endpoints and file names"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._prd_analysis.get('content', '').encode('utf-8', 'ignore'))
+        digest.update(b'\0')
+        digest.update(json.dumps(self._repo_analysis.get('api_endpoints', []), sort_keys=True, default=str).encode('utf-8', 'ignore'))
+        for _, file, _ in self._file_index:
+            digest.update(b'\0')
+            digest.update(file.encode('utf-8', 'ignore'))
+        return digest.digest()
+    
+    def _collect_api_endpoints(self) -> List[Dict]:
+        """Merge repository, PRD and frontend-inferred endpoints, deduplicated by path"""
         all_endpoints = []
         
         # 1. Repository detected endpoints
         repo_endpoints = self._repo_analysis.get('api_endpoints', [])
         for endpoint in repo_endpoints:
+            # Only place endpoint shape is checked; everything downstream assumes dicts
             if isinstance(endpoint, dict):
                 all_endpoints.append(endpoint)
         
@@ -638,30 +1358,40 @@ class GitHubPDFService:
                 seen_paths.add(path)
                 unique_endpoints.append(endpoint)
         
-        return unique_endpoints
+        return self._annotate_endpoints(unique_endpoints)
+    
+    @staticmethod
+    def _annotate_endpoints(endpoints: List[Dict]) -> List[Dict]:
+        """Copy endpoints with the method upper-cased and service label and lowered path resolved once"""
+        annotated = []
+        for ep in endpoints:
+            method = (ep.get('method') or 'GET').upper()
+            path = ep.get('path', '')
+            annotated.append({
+                **ep, 'method': method,
+                '_service': _derive_service(path), '_method': method, '_path_lower': path.lower(),
+            })
+        return annotated
     
     def _analyze_frontend_for_apis(self) -> List[Dict]:
         """Analyze frontend structure to infer API endpoints from actual code patterns"""
         endpoints = []
-        folder_structure = self._repo_analysis.get('folder_structure', {})
         
         # Extract API patterns from file names and folder structure
         api_indicators = set()
         
-        for folder, info in folder_structure.items():
-            if isinstance(info, dict) and 'files' in info:
-                for file in info['files']:
-                    # Extract meaningful names from frontend files
-                    if file.endswith(('.js', '.jsx', '.ts', '.tsx')):
-                        # Extract entity names from file names
-                        file_base = file.replace('.js', '').replace('.jsx', '').replace('.ts', '').replace('.tsx', '')
-                        
-                        # Skip generic files
-                        if file_base.lower() not in ['app', 'index', 'main', 'component', 'utils', 'config']:
-                            # Clean and extract meaningful entity names
-                            entity = re.sub(r'[^a-zA-Z]', '', file_base.lower())
-                            if len(entity) > 2:
-                                api_indicators.add(entity)
+        for _, file, ext in self._file_index:
+            # Extract meaningful names from frontend files
+            if ext in _JS_FILE_EXTS:
+                # Extract entity names from file names
+                file_base = os.path.splitext(file)[0].lower()
+                
+                # Skip generic files
+                if file_base not in _GENERIC_FRONTEND_FILES:
+                    # Clean and extract meaningful entity names
+                    entity = _RE_NON_ALPHA.sub('', file_base)
+                    if len(entity) > 2:
+                        api_indicators.add(entity)
         
         # Generate endpoints from discovered entities
         for entity in api_indicators:
@@ -671,63 +1401,18 @@ class GitHubPDFService:
     
     def _generate_backend_architecture_diagram(self, endpoints: List[Dict]) -> str:
         """Generate professional backend architecture diagram"""
-        from utils.diagram_generator import ProfessionalDiagramGenerator
-        
-        diagram_gen = ProfessionalDiagramGenerator()
-        frontend_tech = self._repo_analysis.get('frontend_tech', ['React'])
-        backend_tech = self._repo_analysis.get('backend_tech', ['FastAPI'])
-        database_tech = self._repo_analysis.get('database_tech', ['PostgreSQL'])
-        
-        # Create a mock repo analysis for the diagram generator
-        mock_repo = MockRepoAnalysis({
-            'frontend_tech': frontend_tech,
-            'backend_tech': backend_tech,
-            'database_tech': database_tech,
-            'api_endpoints': endpoints
-        })
-        
-        # Generate a simple text-based system diagram
-        diagram = f"""
-┌─────────────────┐    ┌─────────────────┐    ┌─────────────────┐
-│    Frontend     │    │     Backend     │    │    Database     │
-│  {frontend_tech[0]:<13} │◄──►│  {backend_tech[0]:<13} │◄──►│  {database_tech[0]:<13} │
-│                 │    │                 │    │                 │
-│ • UI Components │    │ • API Endpoints │    │ • Data Storage  │
-│ • State Mgmt    │    │ • Business Logic│    │ • Transactions  │
-│ • Routing       │    │ • Authentication│    │ • Indexing      │
-└─────────────────┘    └─────────────────┘    └─────────────────┘
-                              │
-                              ▼
-                    {len(endpoints)} API Endpoints
-                    ┌─────────────────┐
-                    │ RESTful Services│
-                    │ • CRUD Ops      │
-                    │ • Data Validation│
-                    │ • Error Handling│
-                    └─────────────────┘"""
+        frontend_tech = self._repo_analysis.get('frontend_tech') or ['React']
+        backend_tech = self._repo_analysis.get('backend_tech') or ['FastAPI']
+        database_tech = self._repo_analysis.get('database_tech') or ['PostgreSQL']
         
-        return diagram
+        return _render_backend_diagram(frontend_tech[0], backend_tech[0], database_tech[0], len(endpoints))
     
     def _group_endpoints_by_service(self, endpoints: List[Dict]) -> Dict[str, List[Dict]]:
         """Group endpoints by service/domain"""
-        services = {}
+        services = defaultdict(list)
         
         for endpoint in endpoints:
-            if isinstance(endpoint, dict):
-                path = endpoint.get('path', '')
-                # Extract service name from path
-                if path.startswith('/api/'):
-                    parts = path.split('/')
-                    if len(parts) > 2:
-                        service_name = parts[2].capitalize()
-                    else:
-                        service_name = 'General'
-                else:
-                    service_name = 'General'
-                
-                if service_name not in services:
-                    services[service_name] = []
-                services[service_name].append(endpoint)
+            services[endpoint['_service']].append(endpoint)
         
         return services
     
@@ -740,8 +1425,7 @@ class GitHubPDFService:
             return insights
         
         # Analyze endpoint patterns
-        methods = [ep.get('method', 'GET') for ep in endpoints if isinstance(ep, dict)]
-        method_counts = {method: methods.count(method) for method in set(methods)}
+        method_counts = Counter(ep['_method'] for ep in endpoints)
         
         insights.append(f"HTTP methods distribution: {', '.join([f'{k}: {v}' for k, v in method_counts.items()])}")
         
@@ -751,15 +1435,15 @@ class GitHubPDFService:
             insights.append(f"Service domains identified: {', '.join(service_groups.keys())}")
         
         # Authentication analysis
-        auth_endpoints = [ep for ep in endpoints if isinstance(ep, dict) and 'auth' in ep.get('path', '').lower()]
-        if auth_endpoints:
-            insights.append(f"Authentication endpoints: {len(auth_endpoints)} detected")
+        auth_count = sum('auth' in ep['_path_lower'] for ep in endpoints)
+        if auth_count:
+            insights.append(f"Authentication endpoints: {auth_count} detected")
         
         # CRUD analysis
         crud_patterns = {'GET': 'Read', 'POST': 'Create', 'PUT': 'Update', 'DELETE': 'Delete'}
-        crud_ops = [crud_patterns.get(method, method) for method in methods if method in crud_patterns]
+        crud_ops = [crud_patterns[method] for method in method_counts if method in crud_patterns]
         if crud_ops:
-            insights.append(f"CRUD operations supported: {', '.join(set(crud_ops))}")
+            insights.append(f"CRUD operations supported: {', '.join(crud_ops)}")
         
         return insights
     
@@ -785,13 +1469,25 @@ class GitHubPDFService:
                 'database_tables': []
             }
         
+        key = hashlib.blake2b(prd_content.encode('utf-8', 'ignore'), digest_size=16).digest()
+        result = self._prd_cache.get(key)
+        if result is None:
+            if len(self._prd_cache) >= _PRD_CACHE_SIZE:
+                del self._prd_cache[next(iter(self._prd_cache))]
+            result = self._prd_cache[key] = self._parse_prd_content_uncached(prd_content)
+        
+        # Callers may extend the returned lists, so hand out a copy of the cached result
+        return copy.deepcopy(result)
+    
+    def _parse_prd_content_uncached(self, prd_content: str) -> Dict[str, Any]:
+        """Run the full PRD parse; use parse_prd_content for the cached entry point"""
         # Clean the content first
         cleaned_content = self._clean_extracted_text(prd_content)
         
         # Extract product name using enhanced method
         product_name = self._extract_enhanced_product_name(cleaned_content)
-        logger.info(f"🔍 DEBUG: Extracted product name: '{product_name}'")
-        logger.info(f"🔍 DEBUG: Cleaned content preview: '{cleaned_content[:200]}...'")
+        logger.debug("🔍 Extracted product name: '%s'", product_name)
+        logger.debug("🔍 Cleaned content preview: '%.200s...'", cleaned_content)
         
         # Extract tech stack with enhanced patterns
         tech_stack = {'languages': [], 'frontend': [], 'backend': [], 'databases': []}
@@ -799,130 +1495,59 @@ class GitHubPDFService:
         # Enhanced tech stack extraction
         content_lower = cleaned_content.lower()
         
-        # Define comprehensive technology mappings
-        tech_keywords = {
-            'languages': ['python', 'javascript', 'java', 'c#', 'csharp', 'php', 'ruby', 'go', 'rust', 'typescript', 'kotlin', 'swift', 'scala', 'clojure'],
-            'frontend': ['react', 'vue', 'angular', 'next.js', 'nextjs', 'nuxt', 'svelte', 'html', 'css', 'bootstrap', 'tailwind', 'material-ui', 'chakra'],
-            'backend': ['fastapi', 'flask', 'django', 'express', 'spring', 'laravel', 'rails', 'gin', 'actix', 'node.js', 'nodejs', 'asp.net', 'koa'],
-            'databases': ['postgresql', 'postgres', 'mysql', 'mongodb', 'redis', 'sqlite', 'oracle', 'cassandra', 'dynamodb', 'elasticsearch', 'mariadb']
-        }
+        # Tokenize once and look tokens up in the keyword index instead of scanning the text per keyword
+        found_keywords = {
+            form for token in set(_TECH_TOKEN_RE.findall(content_lower)) for form in _tech_token_forms(token)
+        } & _TECH_LOOKUP.keys()
         
-        # Extract technologies from content
-        for category, keywords in tech_keywords.items():
-            for keyword in keywords:
-                if keyword in content_lower:
-                    # Normalize names
-                    display_name = {
-                        'nextjs': 'Next.js', 'nodejs': 'Node.js', 'csharp': 'C#',
-                        'postgres': 'PostgreSQL', 'mongodb': 'MongoDB'
-                    }.get(keyword, keyword.title())
-                    
-                    if display_name not in tech_stack[category]:
-                        tech_stack[category].append(display_name)
+        # Extract technologies from content, keeping keyword order within each category
+        for keyword, (category, display_name) in _TECH_LOOKUP.items():
+            if keyword in found_keywords and display_name not in tech_stack[category]:
+                tech_stack[category].append(display_name)
         
-        # Extract features with enhanced patterns
+        # Extract features from "As a user" stories
         features = []
-        
-        # Look for feature sections
-        feature_sections = re.findall(r'(?:core features?|main features?|key features?|features?|functionality)[:\s]*\n([\s\S]*?)(?=\n\d+\.|\n[A-Z][^\n]*:|$)', cleaned_content, re.IGNORECASE)
-        
-        for section in feature_sections:
-            # Extract bullet points and numbered items
-            feature_items = re.findall(r'(?:^|\n)\s*(?:[\-•*]|\d+\.?)\s*([^\n]+)', section, re.MULTILINE)
-            for item in feature_items:
-                clean_feature = item.strip()
-                if len(clean_feature) > 5 and len(clean_feature) < 100:
-                    features.append(clean_feature)
-        
-        # Also look for "As a user" stories
-        user_stories = re.findall(r'as a (?:user|admin|customer)[^\n]*?(?:want to|can)\s+([^\n\.]+)', cleaned_content, re.IGNORECASE)
+        user_stories = _PRD_USER_STORY_RE.findall(cleaned_content)
         for story in user_stories:
             clean_story = story.strip()
             if len(clean_story) > 5 and len(clean_story) < 100:
                 features.append(clean_story)
         
-        # Extract API endpoints with comprehensive patterns
-        api_endpoints = []
-        
-        # Look for API endpoint sections
-        api_sections = re.findall(r'(?:api endpoints?|endpoints?)[:\s]*\n([\s\S]*?)(?=\n\d+\.|\n[A-Z][^\n]*:|$)', cleaned_content, re.IGNORECASE)
-        
-        for section in api_sections:
-            # Extract endpoint patterns
-            endpoint_patterns = [
-                r'/[a-zA-Z][a-zA-Z0-9/_-]*',  # Path patterns
-                r'(?:^|\n)\s*(?:[\-•*]|\d+\.?)\s*([^\n]*(?:api|endpoint)[^\n]*)',  # Bullet points with API/endpoint
-                r'(GET|POST|PUT|DELETE|PATCH)\s+(/[^\s\n]+)',  # HTTP methods with paths
-            ]
-            
-            for pattern in endpoint_patterns:
-                matches = re.findall(pattern, section, re.IGNORECASE | re.MULTILINE)
-                for match in matches:
-                    if isinstance(match, tuple):
-                        api_endpoints.append(f"{match[0]} {match[1]}")
-                    elif isinstance(match, str) and len(match.strip()) > 3:
-                        api_endpoints.append(match.strip())
-        
-        # Extract database tables
-        database_tables = []
-        
-        # Look for database schema sections
-        db_sections = re.findall(r'(?:database schema|schema|tables?)[:\s]*\n([\s\S]*?)(?=\n\d+\.|\n[A-Z][^\n]*:|$)', cleaned_content, re.IGNORECASE)
-        
-        for section in db_sections:
-            # Extract table names from various formats
-            table_patterns = [
-                r'(?:^|\n)\s*(?:[\-•*]|\d+\.?)\s*([A-Za-z][A-Za-z0-9_]*)',  # Bullet points with table names
-                r'\b([A-Za-z][A-Za-z0-9_]*)\s+(?:table|entity)',  # Table/entity mentions
-            ]
-            
-            for pattern in table_patterns:
-                matches = re.findall(pattern, section, re.MULTILINE)
-                for match in matches:
-                    clean_table = match.strip().lower()
-                    if len(clean_table) > 2 and clean_table not in database_tables:
-                        database_tables.append(clean_table)
-        
-        # If no explicit tables found, infer from content
-        if not database_tables:
-            common_entities = ['users', 's', 'rooms', 'bookings', 'products', 'orders', 'customers']
-            for entity in common_entities:
-                if entity.rstrip('s') in content_lower:  # Check singular form
-                    database_tables.append(entity)
+        # Infer database tables from entity mentions in the content
+        words = set(_RE_PRD_WORD.findall(content_lower))
+        database_tables = [
+            table for stem, table in _COMMON_ENTITY_STEMS.items()
+            if stem in words or table in words  # Singular or plural mention
+        ]
         
         result = {
             'product_name': product_name,
             'tech_stack': tech_stack,
             'features': features[:15],  # Limit features
-            'api_endpoints': api_endpoints[:20],  # Limit endpoints
+            'api_endpoints': [],
             'database_tables': database_tables[:10],  # Limit tables
             'content': cleaned_content
         }
         
-        logger.info(f"🔍 DEBUG: Final PRD parse result - Product: '{result['product_name']}'")
+        logger.info("🔍 Final PRD parse result - Product: '%s'", result['product_name'])
         return result
     
-    def _preprocess_prd_content(self, content: str) -> str:
+    @staticmethod
+    def _preprocess_prd_content(content: str) -> str:
         """Preprocess PRD content to improve parsing accuracy"""
         # Remove excessive whitespace and normalize line endings
-        content = re.sub(r'\r\n', '\n', content)
-        content = re.sub(r'\r', '\n', content)
-        content = re.sub(r'\n\s*\n', '\n\n', content)
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+        content = _RE_PRD_BLANK_LINES.sub('\n\n', content)
         
         # Remove PDF artifacts and metadata
-        content = re.sub(r'%PDF-[\d\.]+.*?\n', '', content, flags=re.DOTALL)
-        content = re.sub(r'/[A-Z][a-zA-Z]*\s+\d+\s+\d+\s+R', '', content)
-        content = re.sub(r'<<.*?>>', '', content, flags=re.DOTALL)
-        content = re.sub(r'stream\s*.*?\s*endstream', '', content, flags=re.DOTALL)
+        content = _RE_PRD_PDF_NOISE.sub('', content)
+        for start, end in _PRD_ARTIFACT_DELIMITERS:
+            content = _strip_between(content, start, end)
+        if 'Page ' in content:
+            content = _RE_PRD_PAGE_FOOTER.sub('', content)
         
-        # Clean up common document artifacts
-        content = re.sub(r'Page \d+ of \d+', '', content)
-        content = re.sub(r'\f', '\n', content)  # Form feed to newline
-        content = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]', '', content)  # Remove control characters
-        
-        # Normalize bullet points and numbering
-        content = re.sub(r'•', '•', content)  # Normalize bullet points
-        content = re.sub(r'[\u2010-\u2015]', '-', content)  # Normalize dashes
+        # Control characters, form feeds and dashes in one pass
+        content = content.translate(_PRD_PREPROCESS_TABLE)
         
         return content.strip()
     
@@ -931,30 +1556,19 @@ class GitHubPDFService:
         features = []
         
         # Strategy 1: Look for explicit feature sections
-        feature_patterns = [
-            r'(?:features?|functionality|capabilities)[:\s]*\n([\s\S]*?)(?:\n\n|\n[A-Z]|$)',
-            r'(?:key|core|main)\s+features?[:\s]*\n([\s\S]*?)(?:\n\n|\n[A-Z]|$)',
-            r'(?:requirements?|specifications?)[:\s]*\n([\s\S]*?)(?:\n\n|\n[A-Z]|$)'
-        ]
-        
-        for pattern in feature_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
+        for pattern in _PRD_FEATURE_PATTERNS:
+            matches = pattern.findall(content)
             for match in matches:
                 # Extract bullet points or numbered items
-                items = re.findall(r'(?:•|\*|-|\d+\.)\s*([^\n]+)', match)
+                items = _PRD_BULLET_ITEM_RE.findall(match)
                 features.extend([item.strip() for item in items if len(item.strip()) > 5])
         
         # Strategy 2: Look for action verbs (user stories)
-        action_patterns = [
-            r'(?:user can|users can|ability to|should be able to|will be able to)\s+([^\n\.]+)',
-            r'(?:the system|application|app)\s+(?:will|should|must|can)\s+([^\n\.]+)'
-        ]
-        
-        for pattern in action_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern in _PRD_ACTION_PATTERNS:
+            matches = pattern.findall(content)
             features.extend([match.strip() for match in matches if len(match.strip()) > 10])
         
-        return list(set(features))[:15]  # Limit and deduplicate
+        return _unique_head(features, 15)  # Limit and deduplicate
     
     def _extract_enhanced_api_methods(self, content: str) -> List[str]:
         """Enhanced API method extraction with comprehensive patterns"""
@@ -962,76 +1576,48 @@ class GitHubPDFService:
         
         logger.info("🔍 Starting enhanced API method extraction...")
         
-        # Strategy 1: HTTP methods with paths
-        http_patterns = [
-            r'(GET|POST|PUT|DELETE|PATCH)\s+(/[^\s\n]+)',
-            r'(GET|POST|PUT|DELETE|PATCH)[:\s]+([^\n]+)',
-            r'\b(GET|POST|PUT|DELETE|PATCH)\b[^\n]*(/api/[^\s\n]+)',
-        ]
+        # Per-match logging is debug-only and checked once, so large PRDs don't format a message per hit
+        log_matches = logger.isEnabledFor(logging.DEBUG)
         
-        for i, pattern in enumerate(http_patterns):
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            logger.info(f"🔍 HTTP pattern {i+1}: Found {len(matches)} matches")
+        # Strategy 1: HTTP methods with paths
+        for i, pattern in enumerate(_PRD_HTTP_PATTERNS, 1):
+            matches = pattern.findall(content)
+            logger.info("🔍 HTTP pattern %d: Found %d matches", i, len(matches))
             for match in matches:
                 api_method = f"{match[0]} {match[1]}"
                 api_methods.append(api_method)
-                logger.info(f"✅ Found HTTP method: {api_method}")
+                if log_matches:
+                    logger.debug("✅ Found HTTP method: %s", api_method)
         
         # Strategy 2: API endpoint descriptions and paths
-        endpoint_patterns = [
-            r'(?:endpoint|api)[:\s]*([^\n]+)',
-            r'/api/[a-zA-Z0-9/_-]+',
-            r'(?:route|path)[:\s]*(/[^\s\n]+)',
-            r'\b(\w+)\s+endpoint',
-            r'\b(\w+)\s+API',
-            r'•\s*([^\n]*(?:endpoint|API|api)[^\n]*)',
-            r'-\s*([^\n]*(?:endpoint|API|api)[^\n]*)',
-            r'\d+\.\s*([^\n]*(?:endpoint|API|api)[^\n]*)',
-        ]
-        
-        for i, pattern in enumerate(endpoint_patterns):
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            logger.info(f"🔍 Endpoint pattern {i+1}: Found {len(matches)} matches")
+        for i, pattern in enumerate(_PRD_ENDPOINT_PATTERNS, 1):
+            matches = pattern.findall(content)
+            logger.info("🔍 Endpoint pattern %d: Found %d matches", i, len(matches))
             for match in matches:
                 if isinstance(match, str) and match.strip():
                     api_methods.append(match.strip())
-                    logger.info(f"✅ Found endpoint: {match.strip()}")
+                    if log_matches:
+                        logger.debug("✅ Found endpoint: %s", match.strip())
         
         # Strategy 3: Common API functionality keywords
-        api_keywords = [
-            'login', 'register', 'authenticate', 'logout',
-            'user', 'profile', 'account',
-            'product', 'item', 'catalog',
-            'order', 'purchase', 'payment',
-            'cart', 'basket', 'checkout',
-            'search', 'filter', 'query',
-            'upload', 'download', 'file',
-            'data', 'information', 'record'
-        ]
-        
-        content_lower = content.lower()
-        for keyword in api_keywords:
-            if keyword in content_lower:
-                api_methods.append(f"API for {keyword} functionality")
-                logger.info(f"✅ Inferred API from keyword '{keyword}': API for {keyword} functionality")
+        found_keywords = _find_prd_keywords(content.lower())
+        inferred = [api_method for keyword, api_method in _PRD_API_KEYWORD_METHODS if keyword in found_keywords]
+        api_methods.extend(inferred)
+        logger.info("🔍 Keyword inference: Found %d matches", len(inferred))
         
         # Strategy 4: Look for numbered or bulleted lists that might contain endpoints
-        list_patterns = [
-            r'\d+\.\s*([^\n]+)',  # Numbered lists
-            r'•\s*([^\n]+)',    # Bullet points
-            r'-\s*([^\n]+)',      # Dash points
-            r'\*\s*([^\n]+)',     # Asterisk points
-        ]
-        
-        for pattern in list_patterns:
-            matches = re.findall(pattern, content, re.MULTILINE)
-            for match in matches:
-                if any(keyword in match.lower() for keyword in ['api', 'endpoint', 'service', 'function', 'method']):
-                    api_methods.append(match.strip())
-                    logger.info(f"✅ Found from list: {match.strip()}")
-        
-        unique_methods = list(set(api_methods))[:25]  # Increased limit
-        logger.info(f"🎯 Total unique API methods extracted: {len(unique_methods)}")
+        list_matches = 0
+        for match in _PRD_LIST_ITEM_RE.findall(content):
+            match_lower = match.lower()
+            if any(keyword in match_lower for keyword in _PRD_LIST_API_WORDS):
+                api_methods.append(match.strip())
+                list_matches += 1
+                if log_matches:
+                    logger.debug("✅ Found from list: %s", match.strip())
+        logger.info("🔍 List items: Found %d matches", list_matches)
+        
+        unique_methods = _unique_head(api_methods, 25)  # Increased limit
+        logger.info("🎯 Total unique API methods extracted: %d", len(unique_methods))
         
         return unique_methods
     
@@ -1040,41 +1626,29 @@ class GitHubPDFService:
         tables = []
         
         # Strategy 1: Explicit table mentions
-        table_patterns = [
-            r'(?:table|entity|model)[:\s]*([a-zA-Z_][a-zA-Z0-9_]*)',
-            r'(?:database|db)\s+(?:table|schema)[:\s]*([a-zA-Z_][a-zA-Z0-9_]*)',
-            r'CREATE\s+TABLE\s+([a-zA-Z_][a-zA-Z0-9_]*)',
-        ]
-        
-        for pattern in table_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern in _PRD_TABLE_PATTERNS:
+            matches = pattern.findall(content)
             tables.extend([match.strip() for match in matches if len(match.strip()) > 2])
         
         # Strategy 2: Infer from features (common entities)
-        content_lower = content.lower()
-        common_entities = ['user', 'product', 'order', 'customer', 'item', 'category', 'payment', 'account']
+        found_keywords = _find_prd_keywords(content.lower())
         
-        for entity in common_entities:
-            if entity in content_lower:
+        for entity in _PRD_DB_ENTITIES:
+            if entity in found_keywords:
                 tables.append(f"{entity}s")  # Pluralize
         
-        return list(set(tables))[:10]  # Limit and deduplicate
+        return _unique_head(tables, 10)  # Limit and deduplicate
     
     def _extract_enhanced_goals(self, content: str) -> List[str]:
         """Enhanced goals extraction"""
         goals = []
         
         # Strategy 1: Explicit goal sections
-        goal_patterns = [
-            r'(?:goal|objective|purpose|aim)[s]?[:\s]*\n([\s\S]*?)(?:\n\n|\n[A-Z]|$)',
-            r'(?:mission|vision)[:\s]*([^\n\.]+)'
-        ]
-        
-        for pattern in goal_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
+        for pattern in _PRD_GOAL_PATTERNS:
+            matches = pattern.findall(content)
             for match in matches:
                 # Extract bullet points or sentences
-                items = re.findall(r'(?:•|\*|-|\d+\.)\s*([^\n]+)', match)
+                items = _PRD_BULLET_ITEM_RE.findall(match)
                 if items:
                     goals.extend([item.strip() for item in items if len(item.strip()) > 10])
                 else:
@@ -1082,7 +1656,7 @@ class GitHubPDFService:
                     if len(match.strip()) > 10:
                         goals.append(match.strip())
         
-        return list(set(goals))[:10]  # Limit and deduplicate
+        return _unique_head(goals, 10)  # Limit and deduplicate
     
     def _apply_intelligent_defaults(self, content: str, prd_analysis: Dict) -> Dict:
         """Apply intelligent defaults when PRD parsing yields no results"""
@@ -1124,26 +1698,23 @@ class GitHubPDFService:
     
     def _infer_from_content(self, content: str, base_analysis: Dict) -> Dict:
         """Extract actual content without hardcoded assumptions"""
-        # Only extract what's actually in the content
-        lines = [line.strip() for line in content.split('\n') if line.strip()]
-        
         # Extract any bullet points or numbered items as features
         extracted_features = []
         extracted_apis = []
         extracted_tables = []
         
-        for line in lines:
-            line_clean = line.strip()
-            # Look for actual bullet points or numbered items
-            if re.match(r'^[\u2022\*\-\d+\.]\s+', line_clean):
-                clean_item = re.sub(r'^[\u2022\*\-\d+\.\s]+', '', line_clean)
-                if len(clean_item) > 3:
-                    if any(word in clean_item.lower() for word in ['api', 'endpoint', 'post', 'get', 'put', 'delete']):
-                        extracted_apis.append(clean_item)
-                    elif any(word in clean_item.lower() for word in ['table', 'model', 'entity', 'schema']):
-                        extracted_tables.append(clean_item)
-                    else:
-                        extracted_features.append(clean_item)
+        # Only extract what's actually in the content; the regex yields bullet lines only,
+        # so other lines are never split out or stripped
+        for bullet in _PRD_BULLET_LINE_RE.finditer(content):
+            clean_item = bullet.group(1).strip()
+            if len(clean_item) > 3:
+                item_lower = clean_item.lower()
+                if any(word in item_lower for word in ('api', 'endpoint', 'post', 'get', 'put', 'delete')):
+                    extracted_apis.append(clean_item)
+                elif any(word in item_lower for word in ('table', 'model', 'entity', 'schema')):
+                    extracted_tables.append(clean_item)
+                else:
+                    extracted_features.append(clean_item)
         
         # Only update if we found actual content
         if extracted_features:
@@ -1208,23 +1779,23 @@ class GitHubPDFService:
         if not prd_content:
             return ''
         
-        lines = [line.strip() for line in prd_content.split('\n')[:15] if line.strip()]
+        # Only the preamble matters, so stop splitting after the first 15 lines
+        lines = [line.strip() for line in islice(prd_content.split('\n', 15), 15) if line.strip()]
         
         for line in lines:
-            clean_line = re.sub(r'^[#*\-•\s\d\.]+', '', line).strip()
+            clean_line = _PRD_TITLE_BULLET_RE.sub('', line).strip()
             
             # Skip common document headers
-            if re.match(r'^(table of contents?|prepared by|document|version|date|author)', clean_line, re.IGNORECASE):
+            if _PRD_TITLE_SKIP_RE.match(clean_line):
                 continue
             
             # Look for meaningful titles (not too short, not too long, contains letters)
             if (len(clean_line) > 8 and len(clean_line) < 100 and 
-                re.search(r'[a-zA-Z]', clean_line) and
+                _PRD_TITLE_ALPHA_RE.search(clean_line) and
                 not clean_line.lower().startswith(('by:', 'author:', 'date:', 'version:'))):
                 
                 # Clean up common PRD artifacts
-                title = re.sub(r'\b(prd|product requirements? document|requirements?)\b', '', clean_line, flags=re.IGNORECASE).strip()
-                title = re.sub(r'\s+', ' ', title).strip()
+                title = ' '.join(_PRD_TITLE_ARTIFACT_RE.sub('', clean_line).split())
                 
                 if title and len(title) > 5:
                     return title
@@ -1266,6 +1837,12 @@ class GitHubPDFService:
             self._repo_analysis = self.analyze_repo_from_object(repo_analysis)
         else:
             self._repo_analysis = {}
+        self._file_index = self._build_file_index(self._repo_analysis.get('folder_structure', {}))
+        # Per-extension counts and the set of file names answer the repo detection checks without rescanning
+        self._ext_counts = Counter(ext for _, _, ext in self._file_index)
+        self._file_names = {file for _, file, _ in self._file_index}
+        self._folder_index = self._build_folder_index(self._repo_analysis.get('folder_structure', {}), self._file_names)
+        logger.info("📁 Indexed %d repository files (%d distinct extensions)", len(self._file_index), len(self._ext_counts))
         
         # Handle PRD content - support file path or direct content
         if prd_content:
@@ -1281,15 +1858,22 @@ class GitHubPDFService:
         else:
             self._prd_analysis = self._get_default_prd_analysis()
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # New analyses invalidate everything derived from the previous report
+        self._report_cache = {}
+        
+        # One clock read, so the filename and cover page carry the same timestamp
+        generated_at = datetime.now()
+        timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
         product_name = self._prd_analysis.get('product_name', 'Application').replace(' ', '_').replace('/', '_')
         # Use safe filename
-        safe_filename = re.sub(r'[^\w\-_\.]', '_', f"architecture_report_{product_name}_{timestamp}")
+        safe_filename = _RE_UNSAFE_FILENAME_CHARS.sub('_', f"architecture_report_{product_name}_{timestamp}")
         filename = f"{safe_filename}.pdf"
         filepath = os.path.join(self.output_dir, filename)
         
-        # Ensure output directory exists and is writable
-        os.makedirs(self.output_dir, exist_ok=True)
+        # __init__ already created the output directory; only create it again if output_dir was repointed since
+        if self.output_dir != self._prepared_output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._prepared_output_dir = self.output_dir
         
         doc = SimpleDocTemplate(filepath, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
         story = []
@@ -1301,7 +1885,7 @@ class GitHubPDFService:
         story.append(Spacer(1, 0.2*inch))
         story.append(Paragraph(self._get_description(), self.styles['CustomBody']))
         story.append(Spacer(1, 0.3*inch))
-        story.append(self._create_cover_table(github_url, prd_included))
+        story.append(self._create_cover_table(github_url, prd_included, generated_at))
         story.append(Spacer(1, 0.2*inch))
         story.append(self._create_stats_table())
         story.append(PageBreak())
@@ -1316,118 +1900,105 @@ class GitHubPDFService:
         
         story.append(PageBreak())
         
-        # All sections with dynamic content
-        story.extend(self._create_executive_summary())
-        story.append(PageBreak())
-        story.extend(self._create_goals_scope())
-        story.append(PageBreak())
-        story.extend(self._create_context_diagram())
-        story.append(PageBreak())
-        story.extend(self._create_frontend_section())
-        story.append(PageBreak())
-        story.extend(self._create_backend_section())
-        story.append(PageBreak())
-        story.extend(self._create_api_section())
-        story.append(PageBreak())
-        story.extend(self._create_sequence_diagram_section())
-        story.append(PageBreak())
-        story.extend(self._create_interactions_section())
-        story.append(PageBreak())
-        story.extend(self._create_unified_diagram())
-        story.append(PageBreak())
-        story.extend(self._create_deployment_section())
-        story.append(PageBreak())
-        story.extend(self._create_security_section())
-        story.append(PageBreak())
-        story.extend(self._create_tech_stack_section())
-        story.append(PageBreak())
-        if prd_included:
-            story.extend(self._create_business_alignment())
-            story.append(PageBreak())
-        story.extend(self._create_recommendations_section())
-        story.append(PageBreak())
-        
-        # Add system architecture diagram
-        story.extend(self._create_architecture_diagram_section())
-        story.append(PageBreak())
-        
-        # Add layered data flow diagram
-        story.extend(self._create_layered_dataflow_section())
+        # All sections with dynamic content, separated by page breaks
+        sections = [
+            self._create_executive_summary,
+            self._create_goals_scope,
+            self._create_context_diagram,
+            self._create_frontend_section,
+            self._create_backend_section,
+            self._create_api_section,
+            self._create_sequence_diagram_section,
+            self._create_interactions_section,
+            self._create_unified_diagram,
+            self._create_deployment_section,
+            self._create_security_section,
+            self._create_tech_stack_section,
+            *([self._create_business_alignment] if prd_included else []),
+            self._create_recommendations_section,
+            self._create_architecture_diagram_section,  # System architecture diagram
+            self._create_layered_dataflow_section,  # Layered data flow diagram
+        ]
+        for index, build_section in enumerate(sections):
+            if index:
+                story.append(PageBreak())
+            story.extend(build_section())
         
-        doc.build(story)
+        # reportlab consumes the story list as it lays out pages, so flowables are released during the build;
+        # the per-report values (endpoint lists, summaries) are dropped too instead of living on until the next report
+        try:
+            doc.build(story)
+        finally:
+            self._report_cache = {}
         return filepath
 
     # Dynamic content methods
+    @_per_report
     def _get_product_name(self) -> str:
         product_name = self._prd_analysis.get('product_name', 'Application')
-        logger.info(f"🔍 DEBUG: Raw product_name from PRD analysis: '{product_name}'")
-        logger.info(f"🔍 DEBUG: PRD analysis keys: {list(self._prd_analysis.keys()) if self._prd_analysis else 'None'}")
+        logger.debug("🔍 Raw product_name from PRD analysis: '%s'", product_name)
         
         # Clean up corrupted product names
         if product_name.startswith('%PDF') or 'PDF-1.' in product_name:
-            logger.info(f"🔍 DEBUG: Detected corrupted PDF product name, using fallback")
+            logger.debug("🔍 Detected corrupted PDF product name, using fallback")
             return 'Web Application'
         
         # Always use the extracted product name if it's not the default
         if product_name and product_name != 'Application':
-            logger.info(f"🔍 DEBUG: Using extracted product name: '{product_name}'")
             return product_name
         
-        logger.info(f"🔍 DEBUG: Using default 'Application' name")
+        logger.debug("🔍 Using default 'Application' name")
         return 'Application'
     
     def _extract_enhanced_product_name(self, prd_content: str) -> str:
         """Enhanced product name extraction from PRD content"""
         if not prd_content:
-            logger.info(f"🔍 DEBUG: No PRD content provided")
+            logger.debug("🔍 No PRD content provided")
             return "Application"
         
-        lines = prd_content.strip().split('\n')
-        logger.info(f"🔍 DEBUG: Processing {len(lines)} lines for product name")
+        # Per-line tracing is debug-only and checked once, so normal runs don't format a message per line
+        log_lines = logger.isEnabledFor(logging.DEBUG)
         
         # Look for title patterns in first 10 lines
-        for i, line in enumerate(lines[:10]):
+        for i, line in enumerate(islice(prd_content.strip().split('\n', 10), 10)):
             cleaned_line = line.strip()
-            logger.info(f"🔍 DEBUG: Line {i+1}: '{cleaned_line[:100]}...'")
             
             # Skip empty lines
             if not cleaned_line:
                 continue
             
             # Remove common prefixes and clean the line
-            cleaned_line = re.sub(r'^[#*\-•\s]+', '', cleaned_line)  # Remove markdown, bullets
-            cleaned_line = re.sub(r'[""''„"«»]', '"', cleaned_line)  # Normalize quotes
-            cleaned_line = re.sub(r'[–—−]', '-', cleaned_line)  # Normalize dashes
-            cleaned_line = re.sub(r'[\x00-\x1f\x7f-\x9f]', ' ', cleaned_line)  # Remove control chars
-            cleaned_line = re.sub(r'\s+', ' ', cleaned_line).strip()  # Normalize whitespace
-            
-            logger.info(f"🔍 DEBUG: Cleaned line {i+1}: '{cleaned_line}'")
+            cleaned_line = _PRD_NAME_PREFIX_RE.sub('', cleaned_line)  # Remove markdown, bullets
+            cleaned_line = cleaned_line.translate(_PRD_NAME_CHAR_TABLE)  # Normalize quotes, dashes, control chars
+            cleaned_line = ' '.join(cleaned_line.split())  # Normalize whitespace
             
             # Skip metadata lines
-            if re.match(r'^(Page|Document|Version|Prepared|Table|Product Requirements|PRD|Contents?)\b', cleaned_line, re.IGNORECASE):
-                logger.info(f"🔍 DEBUG: Skipping metadata line: '{cleaned_line}'")
+            if _PRD_NAME_META_RE.match(cleaned_line):
+                if log_lines:
+                    logger.debug("🔍 Skipping metadata line %d: '%s'", i + 1, cleaned_line)
                 continue
             
-            # Look for application/system/platform keywords that indicate a title
-            title_keywords = ['application', 'system', 'platform', 'app', 'service', 'portal', 'dashboard', 'management', 'booking', 'ecommerce', 'marketplace', 'api', 'website', 'tool', 'solution']
-            
             # Check if this looks like a title
-            has_keyword = any(keyword in cleaned_line.lower() for keyword in title_keywords)
-            matches_pattern = re.match(r'^[A-Z][a-zA-Z\s]+[A-Za-z]$', cleaned_line)
+            line_lower = cleaned_line.lower()
+            has_keyword = _PRD_NAME_KEYWORD_RE.search(line_lower) is not None
+            matches_pattern = _PRD_NAME_TITLE_RE.match(cleaned_line)
             
-            logger.info(f"🔍 DEBUG: Line '{cleaned_line}' - Length: {len(cleaned_line)}, Has keyword: {has_keyword}, Matches pattern: {bool(matches_pattern)}")
+            if log_lines:
+                logger.debug("🔍 Line %d '%s' - Length: %d, Has keyword: %s, Matches pattern: %s",
+                             i + 1, cleaned_line, len(cleaned_line), has_keyword, bool(matches_pattern))
             
             if (len(cleaned_line) > 3 and 
                 len(cleaned_line) < 100 and  # Reasonable title length
-                not re.match(r'^\d+\.?\s*$', cleaned_line) and  # Not just numbers
-                not cleaned_line.lower().startswith(('by:', 'author:', 'date:', 'overview')) and
+                not _PRD_NAME_NUMBER_RE.match(cleaned_line) and  # Not just numbers
+                not line_lower.startswith(('by:', 'author:', 'date:', 'overview')) and
                 (has_keyword or matches_pattern)):
-                logger.info(f"🔍 DEBUG: FOUND PRODUCT NAME: '{cleaned_line}'")
+                logger.info("🔍 Found product name: '%s'", cleaned_line)
                 return cleaned_line
         
-        logger.info(f"🔍 DEBUG: No product name found, using default 'Application'")
+        logger.info("🔍 No product name found, using default 'Application'")
         return "Application"
 
+    @_per_report
     def _get_description(self) -> str:
         product = self._get_product_name()
         has_frontend = bool(self._repo_analysis.get('frontend_tech'))
@@ -1446,6 +2017,7 @@ class GitHubPDFService:
         backend_status = 'no backend detected in repo' if not has_backend else 'backend implemented'
         return f"The {product} is a {app_type} {tech_summary}. The repository provides UI/code components. PRD specifies full features and architecture. ({backend_status})"
 
+    @_per_report
     def _get_tech_summary(self) -> str:
         frontend = self._repo_analysis.get('frontend_tech', [])
         backend = self._repo_analysis.get('backend_tech', [])
@@ -1458,11 +2030,12 @@ class GitHubPDFService:
             return f"built with {', '.join(backend[:2])} for the backend"
         else:
             # Infer from languages if available
-            languages = list(self._repo_analysis.get('languages', {}).keys())
+            languages = self._repo_analysis.get('languages', {})
             if languages:
-                return f"using {', '.join(languages[:2])} technologies"
+                return f"using {', '.join(islice(languages, 2))} technologies"
             return "with modern web technologies"
 
+    @_per_report
     def _get_arch_pattern(self) -> str:
         patterns = self._repo_analysis.get('patterns', [])
         if patterns:
@@ -1472,21 +2045,24 @@ class GitHubPDFService:
         else:
             return "Layered Architecture"
 
+    @_per_report
     def _get_complexity_score(self) -> int:
         base = len(self._repo_analysis.get('languages', {})) * 2
         base += len(self._repo_analysis.get('api_endpoints', [])) // 5
         base += self._repo_analysis.get('components_total', 0) // 10
         return min(10, max(3, base))
 
+    @_per_report
     def _get_scalability_level(self) -> str:
-        if any('redis' in tech.lower() for tech in self._repo_analysis.get('database_tech', [])):
+        # One lower() over the joined names; the separator keeps matches from spanning two entries
+        if 'redis' in ' '.join(self._repo_analysis.get('database_tech', [])).lower():
             return "High Scalability"
         elif self._repo_analysis.get('api_endpoints'):
             return "Moderate Scalability"
         else:
             return "Basic Scalability"
 
-    def _create_cover_table(self, github_url: str, prd_included: bool) -> Table:
+    def _create_cover_table(self, github_url: str, prd_included: bool, generated_at: Optional[datetime] = None) -> Table:
         file_count = self._repo_analysis.get('file_count', 0)
         
         # Determine analysis type based on actual detected technologies
@@ -1522,19 +2098,12 @@ class GitHubPDFService:
             ['Generated from:', 'GitHub Repository Analysis'],
             ['Repository URL:', github_url or 'Local Analysis'],
             ['PRD Analysis:', 'Included' if prd_included else 'Not Provided'],
-            ['Generated on:', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+            ['Generated on:', (generated_at or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')],
             ['Analysis Scope:', scope_text]
         ]
         
-        table = Table(data, colWidths=[2*inch, 4*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), self.colors['light_gray']),
-            ('TEXTCOLOR', (0, 0), (-1, -1), self.colors['text']),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, self.colors['medium_gray']),
-        ]))
+        table = Table(data, colWidths=_KEY_VALUE_COL_WIDTHS)
+        table.setStyle(_COVER_TABLE_STYLE)
         
         return table
 
@@ -1547,16 +2116,8 @@ class GitHubPDFService:
             ['Technology Maturity:', 'Modern' if self._repo_analysis.get('build_tools') else 'Standard']
         ]
         
-        table = Table(data, colWidths=[2*inch, 4*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), self.colors['primary']),
-            ('TEXTCOLOR', (0, 0), (0, -1), white),
-            ('TEXTCOLOR', (1, 0), (1, -1), self.colors['text']),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, self.colors['medium_gray']),
-        ]))
+        table = Table(data, colWidths=_KEY_VALUE_COL_WIDTHS)
+        table.setStyle(_STATS_TABLE_STYLE)
         
         return table
 
@@ -1584,11 +2145,10 @@ class GitHubPDFService:
         story = []
         story.append(Paragraph("1. Executive Summary", self.styles['CustomHeading1']))
         
-        # Debug what we actually have
-        logger.info(f"🔍 DEBUG - repo_analysis keys: {list(self._repo_analysis.keys()) if self._repo_analysis else 'None'}")
-        logger.info(f"🔍 DEBUG - prd_analysis keys: {list(self._prd_analysis.keys()) if self._prd_analysis else 'None'}")
-        logger.info(f"🔍 DEBUG - repo_analysis content: {self._repo_analysis}")
-        logger.info(f"🔍 DEBUG - prd_analysis content: {self._prd_analysis}")
+        # Debug what we actually have; the full dumps include the PRD text, so only build them when asked for
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 repo_analysis content: %s", self._repo_analysis)
+            logger.debug("🔍 prd_analysis content: %s", self._prd_analysis)
         
         # Get actual detected values with intelligent inference
         prd_endpoints = self._extract_prd_endpoints()
@@ -1608,7 +2168,7 @@ class GitHubPDFService:
             inferred_backend = self._infer_backend_technologies()
             backend_count = len(inferred_backend)
         
-        languages = list(self._repo_analysis.get('languages', {}).keys())
+        languages = self._repo_analysis.get('languages', {})
         language_count = len(languages)
         
         # Infer languages dynamically if none detected
@@ -1616,34 +2176,28 @@ class GitHubPDFService:
             inferred_languages = self._infer_programming_languages()
             language_count = len(inferred_languages)
         
-        logger.info(f"🔍 RAW COUNTS - APIs: {api_count}, Frontend: {frontend_count}, Backend: {backend_count}, Languages: {language_count}")
-        logger.info(f"🔍 PRD endpoints: {prd_endpoints}")
-        logger.info(f"🔍 Repo endpoints: {repo_endpoints}")
-        logger.info(f"🔍 Backend tech: {backend_tech}")
-        logger.info(f"🔍 Languages: {languages}")
+        logger.info("🔍 RAW COUNTS - APIs: %d, Frontend: %d, Backend: %d, Languages: %d", api_count, frontend_count, backend_count, language_count)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 PRD endpoints: %s", prd_endpoints)
+            logger.debug("🔍 Repo endpoints: %s", repo_endpoints)
+            logger.debug("🔍 Backend tech: %s", backend_tech)
+            logger.debug("🔍 Languages: %s", list(languages))
         
         # Executive summary text
-        summary_text = f"This document presents a comprehensive analysis of the {self._get_product_name()} architecture, generated through automated analysis of the GitHub repository and associated documentation."
-        if backend_count == 0:
-            summary_text += " No backend code detected – recommendations based on PRD requirements."
-        else:
-            summary_text += " Backend components detected and analyzed."
+        backend_note = _SUMMARY_BACKEND_NOTES[backend_count > 0]
+        summary_text = f"This document presents a comprehensive analysis of the {self._get_product_name()} architecture, generated through automated analysis of the GitHub repository and associated documentation. {backend_note}"
         story.append(Paragraph(summary_text, self.styles['CustomBody']))
         story.append(Spacer(1, 0.2*inch))
         
         # Key findings with actual detected values
         story.append(Paragraph("Key Findings:", self.styles['CustomHeading2']))
         
-        findings = [
-            f"• {api_count} API endpoints (repo + PRD) identified and documented",
-            f"• {frontend_count} frontend components analyzed",
-            f"• {backend_count} backend technologies detected",
-            f"• {language_count} programming languages in use",
-            f"• {len(self._get_recommendations())} architectural recommendations provided"
-        ]
-        
-        for finding in findings:
-            story.append(Paragraph(finding, self.styles['CustomBullet']))
+        counts = (api_count, frontend_count, backend_count, language_count, len(self._get_recommendations()))
+        bullet_style = self.styles['CustomBullet']
+        story.extend(
+            Paragraph(template.format(count), bullet_style)
+            for template, count in zip(_EXECUTIVE_FINDING_TEMPLATES, counts)
+        )
         
         return story
     
@@ -1657,7 +2211,7 @@ class GitHubPDFService:
             return max(3, frontend_count // 3)  # Rough estimate
         
         # Check PRD content for API indicators
-        prd_content = self._prd_analysis.get('content', '').lower()
+        prd_content = self._get_prd_content_lower()
         api_indicators = ['api', 'endpoint', 'rest', 'service', 'backend']
         
         if any(indicator in prd_content for indicator in api_indicators):
@@ -1672,7 +2226,7 @@ class GitHubPDFService:
         
         # Force extract PRD endpoints first
         prd_endpoints = self._extract_prd_endpoints()
-        logger.info(f"📊 PRD endpoints extracted: {len(prd_endpoints)}")
+        logger.info("📊 PRD endpoints extracted: %d", len(prd_endpoints))
         
         # Force extract repository data
         repo_languages = list(self._repo_analysis.get('languages', {}).keys())
@@ -1680,7 +2234,7 @@ class GitHubPDFService:
         repo_backend_tech = self._detect_repo_backend_tech()
         repo_endpoints = self._repo_analysis.get('api_endpoints', [])
         
-        logger.info(f"📊 Repo data - Languages: {repo_languages}, Components: {repo_components}, Backend: {repo_backend_tech}")
+        logger.debug("📊 Repo data - Languages: %s, Components: %d, Backend: %s", repo_languages, repo_components, repo_backend_tech)
         
         # Calculate metrics with minimum guarantees
         api_count = len(repo_endpoints) + len(prd_endpoints)
@@ -1688,32 +2242,26 @@ class GitHubPDFService:
             # Force minimum based on PRD content
             if self._prd_analysis.get('content') and len(self._prd_analysis.get('content', '')) > 100:
                 api_count = max(5, len(self._prd_analysis.get('api_methods', [])))  # Minimum 5 if PRD exists
-                logger.info(f"📊 Applied PRD-based API minimum: {api_count}")
+                logger.info("📊 Applied PRD-based API minimum: %d", api_count)
         
         frontend_count = max(repo_components, self._repo_analysis.get('components_total', 0))
         if frontend_count == 0:
             # Check if repo has frontend files
-            folder_structure = self._repo_analysis.get('folder_structure', {})
-            frontend_files = 0
-            for folder, info in folder_structure.items():
-                if isinstance(info, dict) and 'files' in info:
-                    for file in info['files']:
-                        if file.endswith(('.js', '.jsx', '.ts', '.tsx', '.vue', '.html')):
-                            frontend_files += 1
+            frontend_files = self._count_files(_COMPONENT_FILE_EXTS)
             frontend_count = max(frontend_files, 3 if frontend_files > 0 else 0)
-            logger.info(f"📊 Calculated frontend count from files: {frontend_count}")
+            logger.info("📊 Calculated frontend count from files: %d", frontend_count)
         
         backend_count = len(repo_backend_tech)
         if backend_count == 0 and api_count > 0:
             backend_count = 3  # If we have APIs, assume backend exists
-            logger.info(f"📊 Applied backend default due to APIs: {backend_count}")
+            logger.info("📊 Applied backend default due to APIs: %d", backend_count)
         
         language_count = len(repo_languages)
         if language_count == 0:
             # Infer from file extensions in repo
             detected_langs = self._detect_repo_languages()
             language_count = max(len(detected_langs), 2 if frontend_count > 0 or backend_count > 0 else 0)
-            logger.info(f"📊 Detected languages: {detected_langs}, count: {language_count}")
+            logger.info("📊 Detected languages: %s, count: %d", detected_langs, language_count)
         
         final_metrics = {
             'frontend_count': frontend_count,
@@ -1722,44 +2270,30 @@ class GitHubPDFService:
             'language_count': language_count
         }
         
-        logger.info(f"🎯 Final enhanced metrics: {final_metrics}")
+        logger.info("🎯 Final enhanced metrics: %s", final_metrics)
         return final_metrics
     
+    def _count_files(self, extensions: Iterable[str]) -> int:
+        """Number of repository files with any of the given extensions"""
+        return sum(self._ext_counts[ext] for ext in extensions)
+    
+    @_per_report
     def _detect_repo_components(self) -> int:
         """Detect frontend components from repository structure"""
-        component_count = 0
-        
-        # Check for component files in repository
-        folder_structure = self._repo_analysis.get('folder_structure', {})
-        logger.info(f"🔍 Analyzing folder structure: {list(folder_structure.keys())}")
-        
-        for folder, info in folder_structure.items():
-            if isinstance(info, dict) and 'files' in info:
-                folder_lower = folder.lower()
-                files = info['files']
-                logger.info(f"🔍 Folder '{folder}': {len(files)} files")
-                
-                # Count all frontend files, not just in specific folders
-                for file in files:
-                    if file.endswith(('.jsx', '.tsx', '.vue', '.js', '.ts', '.component.ts', '.html')):
-                        component_count += 1
-                        logger.info(f"✅ Found component file: {file}")
+        # Count all frontend files, not just in specific folders
+        component_count = self._count_files(_COMPONENT_FILE_EXTS)
         
         # If no components found, check if we have any frontend files at all
         if component_count == 0:
-            total_frontend_files = 0
-            for folder, info in folder_structure.items():
-                if isinstance(info, dict) and 'files' in info:
-                    for file in info['files']:
-                        if file.endswith(('.js', '.jsx', '.ts', '.tsx', '.vue', '.html', '.css')):
-                            total_frontend_files += 1
+            # Only stylesheets can be left once no component files were found
+            total_frontend_files = self._ext_counts['.css']
             
             # Estimate components based on frontend files
             if total_frontend_files > 0:
                 component_count = max(3, total_frontend_files // 2)  # Estimate
-                logger.info(f"🔍 Estimated {component_count} components from {total_frontend_files} frontend files")
+                logger.info("🔍 Estimated %d components from %d frontend files", component_count, total_frontend_files)
         
-        logger.info(f"🎯 Total components detected: {component_count}")
+        logger.info("🎯 Total components detected: %d", component_count)
         return component_count
     
     def _detect_repo_languages(self) -> List[str]:
@@ -1770,64 +2304,21 @@ class GitHubPDFService:
         existing_languages = self._repo_analysis.get('languages', {})
         if existing_languages:
             languages.update(existing_languages.keys())
-            logger.info(f"🔍 Found existing languages: {list(languages)}")
-        
-        # Also scan folder structure for file extensions
-        folder_structure = self._repo_analysis.get('folder_structure', {})
-        for folder, info in folder_structure.items():
-            if isinstance(info, dict) and 'files' in info:
-                for file in info['files']:
-                    if file.endswith('.py'): 
-                        languages.add('Python')
-                        logger.info(f"✅ Found Python file: {file}")
-                    elif file.endswith(('.js', '.jsx')): 
-                        languages.add('JavaScript')
-                        logger.info(f"✅ Found JavaScript file: {file}")
-                    elif file.endswith(('.ts', '.tsx')): 
-                        languages.add('TypeScript')
-                        logger.info(f"✅ Found TypeScript file: {file}")
-                    elif file.endswith('.java'): 
-                        languages.add('Java')
-                        logger.info(f"✅ Found Java file: {file}")
-                    elif file.endswith('.go'): 
-                        languages.add('Go')
-                        logger.info(f"✅ Found Go file: {file}")
-                    elif file.endswith('.rs'): 
-                        languages.add('Rust')
-                        logger.info(f"✅ Found Rust file: {file}")
-                    elif file.endswith('.php'): 
-                        languages.add('PHP')
-                        logger.info(f"✅ Found PHP file: {file}")
-                    elif file.endswith('.rb'): 
-                        languages.add('Ruby')
-                        logger.info(f"✅ Found Ruby file: {file}")
-                    elif file.endswith(('.html', '.css')): 
-                        languages.add('HTML/CSS')
-                        logger.info(f"✅ Found HTML/CSS file: {file}")
+            logger.debug("🔍 Found existing languages: %s", languages)
+        
+        # Also use the file extensions seen in the folder structure
+        languages.update(language for ext, language in _DETECTED_LANGUAGE_BY_EXT.items() if self._ext_counts[ext])
         
         result = list(languages)
-        logger.info(f"🎯 Total languages detected: {result}")
+        logger.info("🎯 Total languages detected: %s", result)
         return result
     
     def _detect_repo_backend_tech(self) -> List[str]:
         """Detect backend technologies from repository"""
-        backend_tech = []
-        
         # Check for backend framework files
-        for folder, info in self._repo_analysis.get('folder_structure', {}).items():
-            if isinstance(info, dict) and 'files' in info:
-                for file in info['files']:
-                    if file in ['main.py', 'app.py', 'server.py']:
-                        backend_tech.append('FastAPI/Flask')
-                    elif file == 'package.json':
-                        backend_tech.append('Node.js')
-                    elif file in ['pom.xml', 'build.gradle']:
-                        backend_tech.append('Spring Boot')
-                    elif file == 'requirements.txt':
-                        backend_tech.append('Python')
-        
-        return list(set(backend_tech))
+        return list({_BACKEND_MARKER_FILES[file] for file in self._file_names & _BACKEND_MARKER_FILES.keys()})
     
+    @_per_report
     def _extract_prd_endpoints(self) -> List[Dict]:
         """Extract specific API endpoints mentioned in PRD"""
         endpoints = []
@@ -1837,12 +2328,17 @@ class GitHubPDFService:
             return endpoints
         
         # Find explicit endpoint definitions
-        explicit_endpoints = re.findall(r'/(?:api/)?([a-zA-Z/]+)', prd_content)
-        
-        for endpoint_path in explicit_endpoints:
-            if endpoint_path and len(endpoint_path) > 1:
+        # Paths repeat throughout a PRD; the endpoint built for a path is always the same, so build it once.
+        # finditer walks the matches lazily instead of materialising every repeat first
+        seen_paths = set()
+        for match in _PRD_EXPLICIT_PATH_RE.finditer(prd_content):
+            endpoint_path = match.group(1)
+            if len(endpoint_path) > 1:
                 # Clean path
                 clean_path = endpoint_path.strip('/')
+                if clean_path in seen_paths:
+                    continue
+                seen_paths.add(clean_path)
                 if '/' in clean_path:
                     parts = clean_path.split('/')
                     if parts[0] == 'auth':
@@ -1862,86 +2358,50 @@ class GitHubPDFService:
                 })
         
         # Generate CRUD endpoints for database entities
-        entities = self._extract_entities_from_prd(prd_content)
+        entities = self._get_prd_entities()
+        covered = {ep['path'].rsplit('/', 1)[-1] for ep in endpoints}
         for entity in entities:
-            if entity not in [ep['path'].split('/')[-1] for ep in endpoints]:
-                endpoints.extend(self._generate_entity_endpoints(entity))
+            if entity not in covered:
+                entity_endpoints = self._generate_entity_endpoints(entity)
+                endpoints.extend(entity_endpoints)
+                covered.update(ep['path'].rsplit('/', 1)[-1] for ep in entity_endpoints)
         
         return endpoints
     
     def _extract_prd_backend_tech(self) -> List[str]:
         """Extract backend technologies from PRD or provide intelligent defaults"""
         backend_tech = []
-        prd_content = self._prd_analysis.get('content', '').lower()
+        prd_content = self._get_prd_content_lower()
         
-        # Check for explicit technology mentions
-        tech_keywords = {
-            'python': 'Python',
-            'fastapi': 'FastAPI',
-            'django': 'Django',
-            'flask': 'Flask',
-            'node': 'Node.js',
-            'express': 'Express.js',
-            'java': 'Java',
-            'spring': 'Spring Boot',
-            'go': 'Go',
-            'rust': 'Rust'
-        }
+        found_keywords = _find_prd_keywords(prd_content)
         
-        for keyword, tech in tech_keywords.items():
-            if keyword in prd_content:
+        # Check for explicit technology mentions
+        for keyword, tech in _PRD_BACKEND_TECH_KEYWORDS.items():
+            if keyword in found_keywords:
                 backend_tech.append(tech)
         
         # If no backend tech found but PRD has API/backend references, use Python defaults
-        if not backend_tech and any(word in prd_content for word in ['api', 'backend', 'server', 'database']):
+        if not backend_tech and not found_keywords.isdisjoint(_PRD_BACKEND_HINT_WORDS):
             backend_tech = ['Python', 'FastAPI', 'Pydantic']
         
         return backend_tech
     
     def _has_frontend_indicators(self) -> bool:
         """Check if repository has frontend indicators"""
-        folder_structure = self._repo_analysis.get('folder_structure', {})
-        
         # Check for frontend-related folders or files
-        for folder, info in folder_structure.items():
-            folder_lower = folder.lower()
-            if any(pattern in folder_lower for pattern in ['src', 'app', 'frontend', 'client', 'ui']):
-                return True
-            
-            if isinstance(info, dict) and 'files' in info:
-                for file in info['files']:
-                    if file in ['index.html', 'package.json', 'index.js', 'App.js', 'main.js']:
-                        return True
-        
-        return False
+        return self._folder_index.has_frontend_folder or self._folder_index.has_frontend_file
     
+    @_per_report
     def _has_backend_indicators(self) -> bool:
         """Check if repository or PRD has backend indicators"""
-        # Check repository
-        folder_structure = self._repo_analysis.get('folder_structure', {})
-        for folder, info in folder_structure.items():
-            folder_lower = folder.lower()
-            if any(pattern in folder_lower for pattern in ['api', 'server', 'backend', 'service']):
-                return True
-        
-        # Check PRD content
-        prd_content = self._prd_analysis.get('content', '').lower()
-        return any(word in prd_content for word in ['api', 'backend', 'server', 'database', 'endpoint'])
+        # Check repository, then PRD content
+        return self._folder_index.has_backend_folder or _BACKEND_PRD_RE.search(self._get_prd_content_lower()) is not None
     
+    @_per_report
     def _has_api_indicators(self) -> bool:
         """Check if there are API indicators in repository or PRD"""
-        # Check PRD for API mentions
-        prd_content = self._prd_analysis.get('content', '').lower()
-        if any(word in prd_content for word in ['api', 'endpoint', 'rest', 'graphql']):
-            return True
-        
-        # Check repository structure
-        folder_structure = self._repo_analysis.get('folder_structure', {})
-        for folder in folder_structure.keys():
-            if any(pattern in folder.lower() for pattern in ['api', 'routes', 'controllers']):
-                return True
-        
-        return False
+        # Check repository structure, then PRD for API mentions
+        return self._folder_index.has_api_folder or _API_PRD_RE.search(self._get_prd_content_lower()) is not None
 
     def _create_goals_scope(self) -> List:
         story = []
@@ -1951,20 +2411,18 @@ class GitHubPDFService:
         story.append(Paragraph("Architecture Goals:", self.styles['CustomHeading2']))
         goals = self._prd_analysis.get('goals', [])
         
-        if not goals:
-            # Generate context-aware goals
-            if self._repo_analysis.get('frontend_tech'):
-                goals.append("Deliver responsive and intuitive user interface")
-            if self._repo_analysis.get('backend_tech'):
-                goals.append("Implement scalable backend services")
-            goals.extend([
-                "Ensure secure and maintainable code architecture",
-                "Support efficient development and deployment workflows",
-                "Enable cross-platform compatibility and performance"
-            ])
+        if goals:
+            goal_texts = [self._sanitize_text(goal) for goal in goals[:5]]
+        else:
+            # Generate context-aware goals; the defaults are markup-safe literals, so they skip sanitising
+            goal_texts = [
+                *((_FRONTEND_GOAL,) if self._repo_analysis.get('frontend_tech') else ()),
+                *((_BACKEND_GOAL,) if self._repo_analysis.get('backend_tech') else ()),
+                *_DEFAULT_GOALS,
+            ]
         
-        for goal in goals[:5]:
-            story.append(Paragraph(f"• {self._sanitize_text(goal)}", self.styles['CustomBullet']))
+        for goal_text in goal_texts:
+            story.append(Paragraph(f"• {goal_text}", self.styles['CustomBullet']))
         
         return story
 
@@ -1979,21 +2437,20 @@ class GitHubPDFService:
         
         try:
             # Generate visual context flow diagram
-            diagram_generator = ArchitectureDiagramGenerator(self.output_dir)
             frontend_tech = self._repo_analysis.get('frontend_tech', ['React'])
             backend_tech = self._repo_analysis.get('backend_tech', ['FastAPI'])
             database_tech = self._repo_analysis.get('database_tech', ['PostgreSQL'])
             
-            diagram_path = diagram_generator.generate_context_flow_diagram(
+            diagram_path = self._render_diagram(
+                'context_flow',
                 frontend_tech=frontend_tech,
                 backend_tech=backend_tech,
                 database_tech=database_tech
             )
             
             # Embed diagram image
-            from reportlab.platypus import Image
             if os.path.exists(diagram_path):
-                img = Image(diagram_path, width=6.5*inch, height=4.5*inch)
+                img = Image(self._get_embeddable_diagram(diagram_path, 6.5*inch, 4.5*inch), width=6.5*inch, height=4.5*inch)
                 story.append(img)
                 story.append(Spacer(1, 0.2*inch))
         except Exception as e:
@@ -2026,19 +2483,18 @@ class GitHubPDFService:
         
         try:
             # Generate visual frontend architecture diagram
-            diagram_generator = ArchitectureDiagramGenerator(self.output_dir)
             component_names = self._extract_real_component_names()
             
-            diagram_path = diagram_generator.generate_frontend_architecture_diagram(
+            diagram_path = self._render_diagram(
+                'frontend_architecture',
                 frontend_tech=frontend_tech,
                 components_count=components_count,
                 component_names=component_names
             )
             
             # Embed diagram image
-            from reportlab.platypus import Image
             if os.path.exists(diagram_path):
-                img = Image(diagram_path, width=6.5*inch, height=5.5*inch)
+                img = Image(self._get_embeddable_diagram(diagram_path, 6.5*inch, 5.5*inch), width=6.5*inch, height=5.5*inch)
                 story.append(img)
                 story.append(Spacer(1, 0.2*inch))
         except Exception as e:
@@ -2077,15 +2533,12 @@ class GitHubPDFService:
         
         if all_endpoints:
             for endpoint in all_endpoints[:15]:  # Show up to 15 endpoints
-                if isinstance(endpoint, dict):
-                    method = endpoint.get('method', 'GET')
-                    path = endpoint.get('path', '/')
-                    purpose = endpoint.get('purpose', '')
-                    story.append(Paragraph(f"• {method} {path}", self.styles['CustomBullet']))
-                    if purpose:
-                        story.append(Paragraph(f"  Purpose: {purpose}", self.styles['CustomBody']))
-                else:
-                    story.append(Paragraph(f"• {endpoint}", self.styles['CustomBullet']))
+                method = endpoint['method']
+                path = endpoint.get('path', '/')
+                purpose = endpoint.get('purpose', '')
+                story.append(Paragraph(f"• {method} {path}", self.styles['CustomBullet']))
+                if purpose:
+                    story.append(Paragraph(f"  Purpose: {purpose}", self.styles['CustomBody']))
         else:
             story.append(Paragraph("No API endpoints detected in repository or PRD", self.styles['CustomBody']))
         
@@ -2093,19 +2546,18 @@ class GitHubPDFService:
         
         try:
             # Generate visual backend architecture diagram
-            diagram_generator = ArchitectureDiagramGenerator(self.output_dir)
             database_tech = self._repo_analysis.get('database_tech', ['PostgreSQL'])
             
-            diagram_path = diagram_generator.generate_backend_architecture_diagram(
+            diagram_path = self._render_diagram(
+                'backend_architecture',
                 backend_tech=backend_tech,
                 api_count=api_count,
                 database_tech=database_tech
             )
             
             # Embed diagram image
-            from reportlab.platypus import Image
             if os.path.exists(diagram_path):
-                img = Image(diagram_path, width=6.5*inch, height=5.5*inch)
+                img = Image(self._get_embeddable_diagram(diagram_path, 6.5*inch, 5.5*inch), width=6.5*inch, height=5.5*inch)
                 story.append(img)
                 story.append(Spacer(1, 0.2*inch))
         except Exception as e:
@@ -2149,55 +2601,45 @@ class GitHubPDFService:
         
         # Inferred endpoints with detailed specifications
         if inferred_endpoints:
-            story.append(Paragraph("Inferred API Endpoints (Based on Frontend & PRD Analysis):", self.styles['CustomHeading2']))
+            # Styles are looked up once for the whole endpoint list
+            heading_style = self.styles['CustomHeading2']
+            body_style = self.styles['CustomBody']
+            bullet_style = self.styles['CustomBullet']
+            story.append(Paragraph("Inferred API Endpoints (Based on Frontend & PRD Analysis):", heading_style))
             for endpoint in inferred_endpoints:
                 # Endpoint header
-                story.append(Paragraph(f"{endpoint['method']} {endpoint['path']}", self.styles['CustomHeading2']))
-                story.append(Paragraph(f"Purpose: {endpoint['purpose']}", self.styles['CustomBody']))
+                story.append(Paragraph(f"{endpoint['method']} {endpoint['path']}", heading_style))
+                story.append(Paragraph(f"Purpose: {endpoint['purpose']}", body_style))
                 
                 # Request fields table
-                if endpoint.get('request_fields'):
-                    story.append(Paragraph("Request Fields:", self.styles['CustomBullet']))
+                request_fields = endpoint.get('request_fields')
+                if request_fields:
+                    story.append(Paragraph("Request Fields:", bullet_style))
                     req_data = [['Field', 'Type', 'Required', 'Description']]
-                    for field, details in endpoint['request_fields'].items():
-                        req_data.append([
-                            field,
-                            details.get('type', 'string'),
-                            'Yes' if details.get('required', False) else 'No',
-                            details.get('description', 'No description')
-                        ])
+                    req_data.extend([
+                        field,
+                        details.get('type', 'string'),
+                        'Yes' if details.get('required', False) else 'No',
+                        details.get('description', 'No description')
+                    ] for field, details in request_fields.items())
                     
-                    req_table = Table(req_data, colWidths=[1.2*inch, 0.8*inch, 0.7*inch, 2.8*inch])
-                    req_table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), self.colors['light_gray']),
-                        ('TEXTCOLOR', (0, 0), (-1, 0), self.colors['text']),
-                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 8),
-                        ('GRID', (0, 0), (-1, -1), 1, self.colors['medium_gray']),
-                    ]))
+                    req_table = Table(req_data, colWidths=_REQUEST_FIELDS_COL_WIDTHS)
+                    req_table.setStyle(_REQUEST_FIELDS_TABLE_STYLE)
                     story.append(req_table)
                 
                 # Response fields table
-                if endpoint.get('response_fields'):
-                    story.append(Paragraph("Response Fields:", self.styles['CustomBullet']))
+                response_fields = endpoint.get('response_fields')
+                if response_fields:
+                    story.append(Paragraph("Response Fields:", bullet_style))
                     resp_data = [['Field', 'Type', 'Description']]
-                    for field, details in endpoint['response_fields'].items():
-                        resp_data.append([
-                            field,
-                            details.get('type', 'string'),
-                            details.get('description', 'No description')
-                        ])
+                    resp_data.extend([
+                        field,
+                        details.get('type', 'string'),
+                        details.get('description', 'No description')
+                    ] for field, details in response_fields.items())
                     
-                    resp_table = Table(resp_data, colWidths=[1.5*inch, 1*inch, 3*inch])
-                    resp_table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), self.colors['medium_gray']),
-                        ('TEXTCOLOR', (0, 0), (-1, 0), self.colors['text']),
-                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 8),
-                        ('GRID', (0, 0), (-1, -1), 1, self.colors['medium_gray']),
-                    ]))
+                    resp_table = Table(resp_data, colWidths=_RESPONSE_FIELDS_COL_WIDTHS)
+                    resp_table.setStyle(_RESPONSE_FIELDS_TABLE_STYLE)
                     story.append(resp_table)
                 
                 story.append(Spacer(1, 0.15*inch))
@@ -2216,11 +2658,9 @@ class GitHubPDFService:
         story.append(Paragraph(f"7. {project_title} - Sequence Diagram", self.styles['CustomHeading1']))
         
         # Generate dynamic sequence diagram based on detected entities and APIs
-        sequence_diagram = self._generate_dynamic_sequence_diagram()
         story.append(Paragraph("System Interaction Flow:", self.styles['CustomHeading2']))
-        # Split diagram into lines and add each as separate paragraph to preserve formatting
-        diagram_lines = sequence_diagram.strip().split('\n')
-        for line in diagram_lines:
+        # Add each diagram line as separate paragraph to preserve formatting
+        for line in self._generate_dynamic_sequence_diagram_lines():
             story.append(Paragraph(line, self.styles['PlainASCII']))
         
         # Add flow analysis
@@ -2242,11 +2682,10 @@ class GitHubPDFService:
         # Fallback to generic title
         return "System Architecture"
     
-    def _generate_dynamic_sequence_diagram(self) -> str:
-        """Generate dynamic sequence diagram in professional ASCII art style with real data"""
+    def _generate_dynamic_sequence_diagram_lines(self) -> List[str]:
+        """Generate dynamic sequence diagram lines in professional ASCII art style with real data"""
         # Extract real data
-        entities = self._extract_entities_from_prd(self._prd_analysis.get('content', ''))
-        endpoints = self._get_comprehensive_api_endpoints()
+        entities = self._get_prd_entities()
         
         # Get system components with safe access
         frontend_tech_list = self._repo_analysis.get('frontend_tech', [])
@@ -2264,50 +2703,18 @@ class GitHubPDFService:
         # Get product name for title
         product_name = self._get_product_name()
         
-        # Generate professional ASCII art sequence diagram
-        diagram = f"""{product_name} - {main_entity.title()} Management Sequence Diagram (List + Create {main_entity.title()})
-
-+-----------+     +-------------------+     +-------------------+     +-------------+
-|   User    |     |    Frontend       |     |     Backend       |     |  Database   |
-| (Browser) |     | ({frontend_tech:<15}) |     | ({backend_tech:<15}) |     | ({database_tech:<9})|
-+-----------+     +-------------------+     +-------------------+     +-------------+
-    |                   |                         |                         |
-    | 1. Navigate to      |                         |                         |
-    |    {main_entity} page        |                         |                         |
-    |-------------------->|                         |                         |
-    |                   |                         |                         |
-    |                   | 2. GET /api/{main_entity}    |                         |
-    |                   |------------------------>|                         |
-    |                   |                         | 3. SELECT * FROM {main_entity}
-    |                   |                         |------------------------>|
-    |                   |                         |<------------------------|
-    |                   |                         | 4. Return records       |
-    |                   |<------------------------|                         |
-    |                   | 5. 200 OK + JSON        |                         |
-    |<--------------------|                         |                         |
-    | 6. Display {main_entity} list |                         |                         |
-    |                   |                         |                         |
-    | 7. Click "Create"   |                         |                         |
-    |-------------------->|                         |                         |
-    |                   |                         |                         |
-    |                   | 8. POST /api/{main_entity}   |                         |
-    |                   | {{name, desc...}}        |                         |
-    |                   |------------------------>|                         |
-    |                   |                         | 9. INSERT INTO {main_entity}
-    |                   |                         |------------------------>|
-    |                   |                         |<------------------------|
-    |                   |                         | 10. Return new ID       |
-    |                   |<------------------------|                         |
-    |                   | 11. 201 Created + JSON  |                         |
-    |<--------------------|                         |                         |
-    | 12. Success message |                         |                         |
-    |    & update UI      |                         |                         |"""
-        
-        return diagram
+        # Generate professional ASCII art sequence diagram, one line per Paragraph
+        return [
+            line.format(
+                product_name=product_name, main_entity=main_entity, entity_title=main_entity.title(),
+                frontend_tech=frontend_tech, backend_tech=backend_tech, database_tech=database_tech,
+            )
+            for line in _SEQUENCE_DIAGRAM_LINES
+        ]
     
     def _generate_entity_flow_steps(self, entity: str, endpoints: List[Dict], actors: List[str]) -> List[Dict]:
         """Generate flow steps based on main entity (hotel, booking, etc.)"""
-        entity_endpoints = [ep for ep in endpoints if isinstance(ep, dict) and entity in ep.get('path', '').lower()]
+        entity_endpoints = [ep for ep in endpoints if entity in ep.get('path', '').lower()]
         
         if not entity_endpoints:
             return self._generate_default_flow_steps(actors)
@@ -2363,18 +2770,20 @@ class GitHubPDFService:
             flow_insights.append("No API endpoints detected - static frontend application")
             return flow_insights
         
-        # Authentication flow analysis
-        auth_endpoints = [ep for ep in endpoints if isinstance(ep, dict) and 
-                         ('auth' in ep.get('path', '').lower() or 'login' in ep.get('path', '').lower())]
-        if auth_endpoints:
-            flow_insights.append(f"Authentication flow: {len(auth_endpoints)} auth-related endpoints")
-        
-        # Data flow analysis
-        data_endpoints = [ep for ep in endpoints if isinstance(ep, dict) and 
-                         ep.get('method') in ['GET', 'POST', 'PUT', 'DELETE']]
-        if data_endpoints:
-            methods = [ep.get('method') for ep in data_endpoints]
-            flow_insights.append(f"Data flow operations: {', '.join(set(methods))}")
+        # Authentication and data flow analysis in one pass
+        auth_count = 0
+        methods = set()
+        for ep in endpoints:
+            path = ep['_path_lower']
+            if 'auth' in path or 'login' in path:
+                auth_count += 1
+            if ep['_method'] in _DATA_FLOW_METHODS:
+                methods.add(ep['_method'])
+        if auth_count:
+            flow_insights.append(f"Authentication flow: {auth_count} auth-related endpoints")
+        
+        if methods:
+            flow_insights.append(f"Data flow operations: {', '.join(methods)}")
         
         # Frontend-backend communication
         frontend_tech = self._repo_analysis.get('frontend_tech', [])
@@ -2492,7 +2901,7 @@ class GitHubPDFService:
     def _infer_tables_from_prd_analysis(self) -> List[str]:
         """Intelligently infer database tables from PRD content and features"""
         tables = []
-        prd_content = self._prd_analysis.get('content', '').lower()
+        prd_content = self._get_prd_content_lower()
         prd_features = [f.lower() for f in self._prd_analysis.get('features', [])]
         
         # Analyze PRD content for entity patterns
@@ -2533,20 +2942,19 @@ class GitHubPDFService:
         entities = set()
         
         for endpoint in endpoints:
-            if isinstance(endpoint, dict):
-                path = endpoint.get('path', '')
-                # Extract entity from API path
-                path_parts = [p for p in path.split('/') if p and p != 'api']
-                
-                for part in path_parts:
-                    # Clean entity name
-                    clean_part = re.sub(r'[{}]', '', part).lower()
-                    # Skip common non-entity parts
-                    if clean_part not in ['auth', 'login', 'register', 'logout', 'health', 'status', 'id']:
-                        if len(clean_part) > 2 and clean_part.isalpha():
-                            # Convert to singular form for table name
-                            singular = clean_part.rstrip('s') if clean_part.endswith('s') else clean_part
-                            entities.add(singular)
+            path = endpoint.get('path', '')
+            # Extract entity from API path
+            path_parts = [p for p in path.split('/') if p and p != 'api']
+            
+            for part in path_parts:
+                # Clean entity name
+                clean_part = re.sub(r'[{}]', '', part).lower()
+                # Skip common non-entity parts
+                if clean_part not in ['auth', 'login', 'register', 'logout', 'health', 'status', 'id']:
+                    if len(clean_part) > 2 and clean_part.isalpha():
+                        # Convert to singular form for table name
+                        singular = clean_part.rstrip('s') if clean_part.endswith('s') else clean_part
+                        entities.add(singular)
         
         return list(entities)
     
@@ -2596,10 +3004,9 @@ class GitHubPDFService:
         entity_variations = [entity, f"{entity}s", entity.rstrip('s')]
         
         for endpoint in endpoints:
-            if isinstance(endpoint, dict):
-                path = endpoint.get('path', '').lower()
-                if any(var in path for var in entity_variations):
-                    related.append(endpoint)
+            path = endpoint.get('path', '').lower()
+            if any(var in path for var in entity_variations):
+                related.append(endpoint)
         
         return related
     
@@ -2608,18 +3015,17 @@ class GitHubPDFService:
         fields = {}
         
         for endpoint in endpoints:
-            if isinstance(endpoint, dict):
-                # Extract from request fields (POST/PUT operations)
-                request_fields = endpoint.get('request_fields', {})
-                for field_name, field_info in request_fields.items():
-                    if field_name not in ['page', 'limit', 'offset']:  # Skip pagination
-                        fields[field_name] = field_info
-                
-                # Extract from response fields
-                response_fields = endpoint.get('response_fields', {})
-                for field_name, field_info in response_fields.items():
-                    if field_name not in ['data', 'total', 'message', 'token']:  # Skip meta fields
-                        fields[field_name] = field_info
+            # Extract from request fields (POST/PUT operations)
+            request_fields = endpoint.get('request_fields', {})
+            for field_name, field_info in request_fields.items():
+                if field_name not in ['page', 'limit', 'offset']:  # Skip pagination
+                    fields[field_name] = field_info
+            
+            # Extract from response fields
+            response_fields = endpoint.get('response_fields', {})
+            for field_name, field_info in response_fields.items():
+                if field_name not in ['data', 'total', 'message', 'token']:  # Skip meta fields
+                    fields[field_name] = field_info
         
         # Add entity-specific intelligent defaults if no fields detected
         if not fields:
@@ -2852,7 +3258,7 @@ class GitHubPDFService:
         if 'Docker' not in self._repo_analysis.get('build_tools', []):
             recommendations.append("Implement containerization with Docker")
         
-        if not any('test' in tool.lower() for tool in self._repo_analysis.get('build_tools', [])):
+        if 'test' not in ' '.join(self._repo_analysis.get('build_tools', [])).lower():
             recommendations.append("Add comprehensive testing framework")
         
         # General recommendations
@@ -2872,10 +3278,9 @@ class GitHubPDFService:
         
         try:
             # Generate architecture diagram
-            diagram_generator = ArchitectureDiagramGenerator(self.output_dir)
             endpoints = self._get_comprehensive_api_endpoints()
             
-            diagram_path = diagram_generator.generate_system_architecture_diagram(
+            diagram_path = self._get_diagram_generator().generate_system_architecture_diagram(
                 self._repo_analysis, self._prd_analysis, endpoints
             )
             
@@ -2885,9 +3290,8 @@ class GitHubPDFService:
             story.append(Spacer(1, 0.2*inch))
             
             # Add diagram to PDF
-            from reportlab.platypus import Image
             if os.path.exists(diagram_path):
-                img = Image(diagram_path, width=6*inch, height=4.3*inch)
+                img = Image(self._get_embeddable_diagram(diagram_path, 6*inch, 4.3*inch), width=6*inch, height=4.3*inch)
                 story.append(img)
                 story.append(Spacer(1, 0.2*inch))
             
@@ -2910,6 +3314,7 @@ class GitHubPDFService:
         
         try:
             # Generate layered data flow diagram
+            from app.agents.architecture.services.layered_diagram_generator import LayeredDataFlowGenerator
             layered_generator = LayeredDataFlowGenerator(self.output_dir)
             endpoints = self._get_comprehensive_api_endpoints()
             
@@ -2929,9 +3334,8 @@ class GitHubPDFService:
             story.append(Spacer(1, 0.2*inch))
             
             # Add diagram to PDF
-            from reportlab.platypus import Image
             if os.path.exists(diagram_path):
-                img = Image(diagram_path, width=7*inch, height=5*inch)
+                img = Image(self._get_embeddable_diagram(diagram_path, 7*inch, 5*inch), width=7*inch, height=5*inch)
                 story.append(img)
                 story.append(Spacer(1, 0.2*inch))
             
@@ -2971,7 +3375,7 @@ class GitHubPDFService:
             
             # Source 1: Extract from PRD Features (highest priority)
             prd_features = self._prd_analysis.get('features', [])
-            prd_content = self._prd_analysis.get('content', '').lower()
+            prd_content = self._get_prd_content_lower()
             product_name = self._prd_analysis.get('product_name', 'Application')
             
             # Analyze PRD content for key nouns (entities)
@@ -3019,14 +3423,13 @@ class GitHubPDFService:
             endpoints = self._get_comprehensive_api_endpoints()
             endpoint_entities = set()
             for ep in endpoints:
-                if isinstance(ep, dict):
-                    path = ep.get('path', '')
-                    # Extract entity from path like /api/clocks, /api/timezones
-                    parts = [p for p in path.split('/') if p and p not in ['api', 'v1', 'v2', 'auth', 'login', 'register']]
-                    if parts:
-                        entity = parts[0].capitalize()
-                        if len(entity) > 3:
-                            endpoint_entities.add(entity)
+                path = ep.get('path', '')
+                # Extract entity from path like /api/clocks, /api/timezones
+                parts = [p for p in path.split('/') if p and p not in ['api', 'v1', 'v2', 'auth', 'login', 'register']]
+                if parts:
+                    entity = parts[0].capitalize()
+                    if len(entity) > 3:
+                        endpoint_entities.add(entity)
             
             entity_candidates.update(endpoint_entities)
             
@@ -3067,16 +3470,12 @@ class GitHubPDFService:
             
             # Try to find actual endpoint that matches
             for ep in endpoints:
-                if isinstance(ep, dict):
-                    path = ep.get('path', '')
-                    if selected_entity_lower in path.lower():
-                        api_route = path
-                        break
+                if selected_entity_lower in ep['_path_lower']:
+                    api_route = ep.get('path', '')
+                    break
             
             # 6. Generate Dynamic Diagram based on actual endpoints
-            diagram_generator = ArchitectureDiagramGenerator(self.output_dir)
-            
-            diagram_path = diagram_generator.generate_sequence_diagram(
+            diagram_path = self._get_diagram_generator().generate_sequence_diagram(
                 project_name=product_name,
                 entity_name=selected_entity,
                 endpoints=endpoints  # Pass actual endpoints for dynamic flow generation
@@ -3088,9 +3487,8 @@ class GitHubPDFService:
             story.append(Spacer(1, 0.1*inch))
             
             # 8. Embed image
-            from reportlab.platypus import Image
             if os.path.exists(diagram_path):
-                img = Image(diagram_path, width=7*inch, height=5*inch)
+                img = Image(self._get_embeddable_diagram(diagram_path, 7*inch, 5*inch), width=7*inch, height=5*inch)
                 story.append(img)
                 story.append(Spacer(1, 0.2*inch))
             
@@ -3123,10 +3521,9 @@ class GitHubPDFService:
         if endpoints:
             entities = set()
             for ep in endpoints:
-                if isinstance(ep, dict):
-                    path = ep.get('path', '')
-                    parts = [p for p in path.split('/') if p and p != 'api']
-                    entities.update(parts)
+                path = ep.get('path', '')
+                parts = [p for p in path.split('/') if p and p != 'api']
+                entities.update(parts)
             
             insights.append(f"System manages {len(entities)} main entities through {len(endpoints)} API endpoints")
         
@@ -3183,7 +3580,7 @@ class GitHubPDFService:
     def _infer_database_tables_from_prd(self) -> List[str]:
         """Infer database tables from PRD content using LLM analysis"""
         tables = []
-        prd_content = self._prd_analysis.get('content', '').lower()
+        prd_content = self._get_prd_content_lower()
         
         # Common entity patterns to look for
         entity_patterns = {
@@ -3445,7 +3842,7 @@ class GitHubPDFService:
         entity_lower = entity.lower()
         
         # Analyze PRD content for entity-specific attributes
-        prd_content = self._prd_analysis.get('content', '').lower()
+        prd_content = self._get_prd_content_lower()
         
         # Look for attributes mentioned near this entity
         entity_context = self._extract_entity_context(entity_lower, prd_content)